@@ -1,23 +1,20 @@
-from abc import ABCMeta, abstractmethod
-from dataclasses import dataclass
-from typing import Any, TypeVar
+from dataclasses import dataclass, fields
+from typing import Any, Protocol, Tuple, TypeVar
 
 
 X = TypeVar('X')
 
 
-class Closeable(metaclass=ABCMeta):
-    @abstractmethod
+class Closeable(Protocol):
     def close(self) -> None:
         """ Close this to free resources and deny further use. """
-        raise NotImplementedError()
+        ...
 
 
-class Resettable(metaclass=ABCMeta):
-    @abstractmethod
+class Resettable(Protocol):
     def reset(self) -> None:
         """ Reset this to a known good state for further use. """
-        raise NotImplementedError()
+        ...
 
 
 class Void:
@@ -38,6 +35,8 @@ class Void:
 class Unit:
     """ A simple type with one inhabitant (according to eq and hash). """
 
+    __slots__ = ()
+
     @staticmethod
     def instance() -> 'Unit':
         return _UNIT_SINGLETON
@@ -46,6 +45,22 @@ class Unit:
 _UNIT_SINGLETON = Unit()
 
 
+class FrozenSlots:
+    """
+    Mixin for frozen slotted classes. Copy and pickle restore instances attribute
+    by attribute, which frozen classes refuse, so rebuild them through `__init__` instead.
+    """
+
+    __slots__ = ()
+
+    def _init_args(self) -> Tuple[Any, ...]:
+        """ Arguments to `__init__` that rebuild this (defaults to the dataclass init fields). """
+        return tuple(getattr(self, f.name) for f in fields(self) if f.init)  # type: ignore[arg-type]
+
+    def __reduce__(self) -> Tuple[type, Tuple[Any, ...]]:
+        return (type(self), self._init_args())
+
+
 class MatchException(Exception):
     def __init__(self, value: Any) -> None:
         super().__init__(f'Failed to match value: {value}')
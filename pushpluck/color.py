@@ -1,49 +1,53 @@
 from dataclasses import dataclass
-from typing import Dict, Generator
+from pushpluck.base import FrozenSlots
+from typing import Dict, Iterator
 
 
 @dataclass(frozen=True)
-class Color:
+class Color(FrozenSlots):
+    __slots__ = ('red', 'green', 'blue')
+
     red: int
     green: int
     blue: int
 
-    def __iter__(self) -> Generator[int, None, None]:
-        yield self.red
-        yield self.green
-        yield self.blue
+    def __iter__(self) -> Iterator[int]:
+        return iter((self.red, self.green, self.blue))
 
     def to_code(self) -> str:
-        nums = ''.join(f'{x:02x}' for x in self)
-        return f'#{nums.upper()}'
+        return f'#{self.red:02X}{self.green:02X}{self.blue:02X}'
 
     @classmethod
     def from_code(cls, code: str) -> 'Color':
         assert code[0] == '#'
-        red = int(code[1:3], 16)
-        green = int(code[3:5], 16)
-        blue = int(code[5:7], 16)
+        color = _COLOR_BY_CODE.get(code.upper())
+        if color is not None:
+            return color
+        red, green, blue = bytes.fromhex(code[1:7])
         return cls(red, green, blue)
 
 
 COLORS: Dict[str, Color] = {
-    'Black': Color.from_code('#000000'),
-    'DarkGrey': Color.from_code('#A9A9A9'),
-    'Gray': Color.from_code('#808080'),
-    'White': Color.from_code('#FFFFFF'),
-    'Red': Color.from_code('#FF0000'),
-    'Yellow': Color.from_code('#FFFF00'),
-    'Lime': Color.from_code('#00FF00'),
-    'Green': Color.from_code('#008000'),
-    'Spring': Color.from_code('#00FF7F'),
-    'Turquoise': Color.from_code('#40E0D0'),
-    'Cyan': Color.from_code('#00FFFF'),
-    'Sky': Color.from_code('#87CEEB'),
-    'Blue': Color.from_code('#0000FF'),
-    'Orchid': Color.from_code('#DA70D6'),
-    'Magenta': Color.from_code('#FF00FF'),
-    'Pink': Color.from_code('#FFC0CB'),
-    'Orange': Color.from_code('#FFA580'),
-    'Indigo': Color.from_code('#4B0082'),
-    'Violet': Color.from_code('#EE82EE')
+    'Black': Color(0, 0, 0),
+    'DarkGrey': Color(0xA9, 0xA9, 0xA9),
+    'Gray': Color(0x80, 0x80, 0x80),
+    'White': Color(0xFF, 0xFF, 0xFF),
+    'Red': Color(0xFF, 0, 0),
+    'Yellow': Color(0xFF, 0xFF, 0),
+    'Lime': Color(0, 0xFF, 0),
+    'Green': Color(0, 0x80, 0),
+    'Spring': Color(0, 0xFF, 0x7F),
+    'Turquoise': Color(0x40, 0xE0, 0xD0),
+    'Cyan': Color(0, 0xFF, 0xFF),
+    'Sky': Color(0x87, 0xCE, 0xEB),
+    'Blue': Color(0, 0, 0xFF),
+    'Orchid': Color(0xDA, 0x70, 0xD6),
+    'Magenta': Color(0xFF, 0, 0xFF),
+    'Pink': Color(0xFF, 0xC0, 0xCB),
+    'Orange': Color(0xFF, 0xA5, 0x80),
+    'Indigo': Color(0x4B, 0, 0x82),
+    'Violet': Color(0xEE, 0x82, 0xEE)
 }
+
+# Named colors by uppercase code, to skip parsing common codes
+_COLOR_BY_CODE: Dict[str, Color] = {color.to_code(): color for color in COLORS.values()}
@@ -36,7 +36,8 @@ class MappedComponent(Generic[C, X, R], Component[C, R]):
 
     def handle_config(self, root_config: C, reset: bool) -> Optional[R]:
         config = type(self).extract_config(root_config)
-        if config != self._config or reset:
+        # Check identity first to skip structural comparison of unchanged configs
+        if reset or (config is not self._config and config != self._config):
             return self.handle_mapped_config(config)
         else:
             return None
@@ -1,11 +1,12 @@
 from abc import ABCMeta, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum, auto, unique
+from operator import attrgetter
 from pushpluck import constants
 from pushpluck.base import MatchException
 from pushpluck.color import COLORS, Color
 from pushpluck.scale import SCALE_LOOKUP, NoteName, Scale
-from typing import List, Optional, TypeVar
+from typing import Callable, Dict, NamedTuple, Optional, Tuple, TypeVar
 
 T = TypeVar('T')
 
@@ -17,8 +18,7 @@ class NoteType(Enum):
     Other = auto()
 
 
-@dataclass(frozen=True)
-class ColorScheme:
+class ColorScheme(NamedTuple):
     root_note: Color
     member_note: Color
     other_note: Color
@@ -37,17 +37,22 @@ class VisState(Enum):
     OnDisabled = auto()
     OnLinked = auto()
 
-    @property
-    def primary(self) -> bool:
-        return self == VisState.OnPrimary
+    # Flags precomputed per member below (see _init_vis_flags)
+    index: int
+    primary: bool
+    active: bool
+    enabled: bool
+
+
+def _init_vis_flags() -> None:
+    for index, vis in enumerate(VisState):
+        vis.index = index
+        vis.primary = vis is VisState.OnPrimary
+        vis.active = vis is not VisState.Off
+        vis.enabled = vis is not VisState.OnDisabled
 
-    @property
-    def active(self) -> bool:
-        return self != VisState.Off
 
-    @property
-    def enabled(self) -> bool:
-        return self != VisState.OnDisabled
+_init_vis_flags()
 
 
 class PadColorMapper(metaclass=ABCMeta):
@@ -55,6 +60,10 @@ class PadColorMapper(metaclass=ABCMeta):
     def get_color(self, scheme: ColorScheme, vis: VisState) -> Optional[Color]:
         raise NotImplementedError()
 
+    def resolve(self, scheme: ColorScheme) -> Tuple[Optional[Color], ...]:
+        """ Colors for every vis state, indexed by VisState.index """
+        return tuple(self.get_color(scheme, vis) for vis in VisState)
+
     @staticmethod
     def note(note_type: NoteType) -> 'NotePadColorMapper':
         return NotePadColorMapper(note_type)
@@ -71,23 +80,42 @@ class PadColorMapper(metaclass=ABCMeta):
 @dataclass(frozen=True)
 class NotePadColorMapper(PadColorMapper):
     note_type: NoteType
+    _getters: Dict[VisState, Callable[[ColorScheme], Color]] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, '_getters', _NOTE_COLOR_GETTERS[self.note_type])
 
     def get_color(self, scheme: ColorScheme, vis: VisState) -> Optional[Color]:
-        if vis == VisState.OnPrimary:
-            return scheme.primary_note
-        elif vis == VisState.OnDisabled:
-            return scheme.disabled_note
-        elif vis == VisState.OnLinked:
-            return scheme.linked_note
+        return self._getters[vis](scheme)
+
+
+def _note_color_field(note_type: NoteType, vis: VisState) -> str:
+    if vis == VisState.OnPrimary:
+        return 'primary_note'
+    elif vis == VisState.OnDisabled:
+        return 'disabled_note'
+    elif vis == VisState.OnLinked:
+        return 'linked_note'
+    else:
+        if note_type == NoteType.Root:
+            return 'root_note'
+        elif note_type == NoteType.Member:
+            return 'member_note'
+        elif note_type == NoteType.Other:
+            return 'other_note'
         else:
-            if self.note_type == NoteType.Root:
-                return scheme.root_note
-            elif self.note_type == NoteType.Member:
-                return scheme.member_note
-            elif self.note_type == NoteType.Other:
-                return scheme.other_note
-            else:
-                raise MatchException(self.note_type)
+            raise MatchException(note_type)
+
+
+def _build_note_color_getters() -> Dict[NoteType, Dict[VisState, Callable[[ColorScheme], Color]]]:
+    d: Dict[NoteType, Dict[VisState, Callable[[ColorScheme], Color]]] = {}
+    for note_type in NoteType:
+        d[note_type] = {vis: attrgetter(_note_color_field(note_type, vis)) for vis in VisState}
+    return d
+
+
+# Scheme color getters for note pads, resolved once for every note type and vis state
+_NOTE_COLOR_GETTERS = _build_note_color_getters()
 
 
 @dataclass(frozen=True)
@@ -131,7 +159,7 @@ class ChannelMode(Enum):
 # class Profile:
 #     instrument_name: str
 #     tuning_name: str
-#     tuning: List[int]
+#     tuning: Tuple[int, ...]
 #     orientation: Orientation
 
 
@@ -139,7 +167,7 @@ class ChannelMode(Enum):
 class Config:
     instrument_name: str
     tuning_name: str
-    tuning: List[int]
+    tuning: Tuple[int, ...]
     layout: Layout
     play_mode: PlayMode
     chan_mode: ChannelMode
@@ -1,5 +1,5 @@
 from enum import Enum, auto, unique
-from typing import Dict, Tuple, Type, TypeVar
+from typing import Dict, List, Optional, Tuple, Type, TypeVar
 
 E = TypeVar('E', bound=Enum)
 
@@ -11,6 +11,13 @@ def make_enum_value_lookup(enum_type: Type[E]) -> Dict[int, E]:
     return lookup
 
 
+def make_enum_value_table(lookup: Dict[int, E], size: int) -> Tuple[Optional[E], ...]:
+    table: List[Optional[E]] = [None] * size
+    for value, enum_val in lookup.items():
+        table[value] = enum_val
+    return tuple(table)
+
+
 # How long to sleep between midi output messages
 # so we don't flood the push
 DEFAULT_PUSH_DELAY = 0.0008
@@ -62,13 +69,26 @@ class KnobCC(Enum):
 KNOB_CC_VALUE_LOOKUP: Dict[int, KnobCC] = make_enum_value_lookup(KnobCC)
 
 
+def _build_knob_group_lookup() -> Dict[KnobCC, Tuple[KnobGroup, int]]:
+    right_start = KnobCC.R0.value
+    center_start = KnobCC.C0.value
+    left_start = KnobCC.L0.value
+    lookup: Dict[KnobCC, Tuple[KnobGroup, int]] = {}
+    for knob in KnobCC:
+        if knob.value >= right_start:
+            lookup[knob] = (KnobGroup.Right, knob.value - right_start)
+        elif knob.value >= center_start:
+            lookup[knob] = (KnobGroup.Center, knob.value - center_start)
+        else:
+            lookup[knob] = (KnobGroup.Left, knob.value - left_start)
+    return lookup
+
+
+_KNOB_GROUP_LOOKUP: Dict[KnobCC, Tuple[KnobGroup, int]] = _build_knob_group_lookup()
+
+
 def knob_group_and_offset(knob: KnobCC) -> Tuple[KnobGroup, int]:
-    if knob.value >= KnobCC.R0.value:
-        return KnobGroup.Right, knob.value - KnobCC.R0.value
-    elif knob.value >= KnobCC.C0.value:
-        return KnobGroup.Center, knob.value - KnobCC.C0.value
-    else:
-        return KnobGroup.Left, knob.value - KnobCC.L0.value
+    return _KNOB_GROUP_LOOKUP[knob]
 
 
 @unique
@@ -135,6 +155,12 @@ TIME_DIV_CC_VALUE_LOOKUP: Dict[int, TimeDivCC] = make_enum_value_lookup(TimeDivC
 MIDI_BASE_CHANNEL = 1
 MIDI_MIN_CHANNEL = 1
 MIDI_MAX_CHANNEL = 16
+MIDI_NUM_NOTES = 128
+MIDI_NUM_CONTROLS = 128
+
+# Enum members indexed directly by control number (None where unassigned)
+BUTTON_CC_VALUE_TABLE: Tuple[Optional[ButtonCC], ...] = make_enum_value_table(BUTTON_CC_VALUE_LOOKUP, MIDI_NUM_CONTROLS)
+TIME_DIV_CC_VALUE_TABLE: Tuple[Optional[TimeDivCC], ...] = make_enum_value_table(TIME_DIV_CC_VALUE_LOOKUP, MIDI_NUM_CONTROLS)
 
 DEFAULT_PUSH_PORT_NAME = 'Ableton Push User Port'
 DEFAULT_PROCESSED_PORT_NAME = 'pushpluck'
@@ -156,4 +182,4 @@ DISPLAY_HALF_BLOCK_LEN = DISPLAY_BLOCK_LEN // 2
 DISPLAY_MAX_LINE_LEN = DISPLAY_MAX_BLOCKS * DISPLAY_BLOCK_LEN
 DISPLAY_BUFFER_LEN = DISPLAY_MAX_ROWS * DISPLAY_MAX_LINE_LEN
 
-STANDARD_TUNING = [40, 45, 50, 55, 59, 64]
+STANDARD_TUNING = (40, 45, 50, 55, 59, 64)
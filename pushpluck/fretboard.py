@@ -1,33 +1,55 @@
 from abc import ABCMeta, abstractmethod
-from bisect import bisect_left
 from dataclasses import dataclass
+from functools import lru_cache
 from mido.frozen import FrozenMessage
 from pushpluck import constants
-from pushpluck.base import MatchException
+from pushpluck.base import FrozenSlots, MatchException
 from pushpluck.config import ChannelMode, Config, PlayMode, VisState
-from pushpluck.midi import is_note_on_msg, is_note_off_msg, is_note_msg
+from pushpluck.midi import is_note_on_msg, is_note_off_msg, is_note_msg, make_note_off_msg, make_note_on_msg
 from pushpluck.component import MappedComponent, MappedComponentConfig
-from typing import Dict, Generator, List, Optional, Set
+from typing import Dict, Generator, List, Optional, Sequence, Tuple
 
 
 @dataclass(frozen=True)
-class StringPos:
+class StringPos(FrozenSlots):
+    __slots__ = ('str_index', 'fret', '_hash')
+
     # Which string (0 to max strings in tuning)
     str_index: int
     # Which fret (equivalently, semitone offset from base string tuning)
     # N.B. Negative frets make sense in this world.
     fret: int
 
+    def __post_init__(self) -> None:
+        # Positions are immutable, so compute the hash once
+        # (kept out of the dataclass fields so it stays out of init/repr/eq)
+        object.__setattr__(self, '_hash', (self.str_index << 8) + self.fret)
+
+    # Compared and hashed by hand to avoid building field tuples,
+    # since string positions are frequent dict keys on the note path.
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, StringPos):
+            return NotImplemented
+        return self.str_index == other.str_index and self.fret == other.fret
+
+    def __hash__(self) -> int:
+        return self._hash  # type: ignore[attr-defined]
+
 
 @dataclass(frozen=True)
-class NoteGroup:
+class NoteGroup(FrozenSlots):
+    __slots__ = ('note', 'primary', 'equivs')
+
     note: int
     primary: Optional[StringPos]
     equivs: List[StringPos]
 
 
 @dataclass(frozen=True)
-class FretboardMessage:
+class FretboardMessage(FrozenSlots):
+    # _note_off memoizes make_note_off_msg and is not a field
+    __slots__ = ('str_pos', 'equivs', 'msg', '_note_off')
+
     # Position on strings/frets
     str_pos: StringPos
     # Equivalent positions in the note group
@@ -64,20 +86,27 @@ class FretboardMessage:
         return FretboardMessage(
             self.str_pos,
             self.equivs,
-            FrozenMessage(
-                type='note_on',
-                channel=self.channel,
-                note=self.note,
-                velocity=velocity
-            )
+            make_note_on_msg(self.channel, self.note, velocity)
         )
 
     def make_note_off_msg(self) -> 'FretboardMessage':
-        return self.make_note_msg(0)
+        # Messages are immutable and themselves cached by the fretboard,
+        # so build the matching note off once and share it
+        note_off: Optional[FretboardMessage] = getattr(self, '_note_off', None)
+        if note_off is None:
+            note_off = FretboardMessage(
+                self.str_pos,
+                self.equivs,
+                make_note_off_msg(self.channel, self.note)
+            )
+            object.__setattr__(self, '_note_off', note_off)
+        return note_off
 
 
 @dataclass(frozen=True)
-class StringBounds:
+class StringBounds(FrozenSlots):
+    __slots__ = ('low', 'high')
+
     low: StringPos
     high: StringPos
 
@@ -94,18 +123,24 @@ class StringBounds:
 
 
 @dataclass(frozen=True)
-class NoteEffects:
+class NoteEffects(FrozenSlots):
+    __slots__ = ('vis', 'msgs')
+
     vis: Dict[StringPos, VisState]
     msgs: List[FrozenMessage]
 
     @classmethod
     def empty(cls) -> 'NoteEffects':
-        return cls({}, [])
+        # Shared instance - callers must not mutate it
+        return _EMPTY_EFFECTS
 
     def is_empty(self) -> bool:
         return len(self.vis) == 0 and len(self.msgs) == 0
 
 
+_EMPTY_EFFECTS = NoteEffects({}, [])
+
+
 class ChannelMapper(metaclass=ABCMeta):
     @abstractmethod
     def map_channel(self, str_pos: StringPos) -> Optional[int]:
@@ -127,16 +162,18 @@ class MultiChannelMapper(ChannelMapper):
         min_channel: int,
         max_channel: int
     ) -> None:
-        self._base_channel = base_channel
-        self._min_channel = min_channel
-        self._max_channel = max_channel
+        # Channels indexed by string (None where out of range)
+        self._channels: Tuple[Optional[int], ...] = tuple(
+            channel if channel >= min_channel else None
+            for channel in range(base_channel, max_channel + 1)
+        )
 
     def map_channel(self, str_pos: StringPos) -> Optional[int]:
-        channel = str_pos.str_index + self._base_channel
-        if channel < self._min_channel or channel > self._max_channel:
+        str_index = str_pos.str_index
+        if str_index < 0 or str_index >= len(self._channels):
             return None
         else:
-            return channel
+            return self._channels[str_index]
 
 
 class Tuner(metaclass=ABCMeta):
@@ -153,208 +190,249 @@ class Tuner(metaclass=ABCMeta):
 # (An alternative may be defined by differences between strings,
 # supporting an "infinite" number of strings.)
 class FixedTuner(Tuner):
-    def __init__(self, tuning: List[int], bounds: Optional[StringBounds]) -> None:
+    def __init__(self, tuning: Tuple[int, ...], bounds: Optional[StringBounds]) -> None:
         self._tuning = tuning
         self._bounds = bounds
-        self._note_lookup = self._make_note_lookup()
-        self._equivs_lookup = self._make_equivs_lookup()
-
-    def _make_note_lookup(self) -> Dict[StringPos, int]:
-        lookup: Dict[StringPos, int] = {}
+        # Tables are indexed by offsets from the low corner of the bounds
+        if bounds is None:
+            self._low_str_index = 0
+            self._low_fret = 0
+            self._num_frets = 0
+        else:
+            self._low_str_index = bounds.low.str_index
+            self._low_fret = bounds.low.fret
+            self._num_frets = bounds.high.fret - bounds.low.fret + 1
+        self._note_table, self._equivs_table = self._make_tables()
+
+    def _make_tables(self) -> Tuple[List[List[Optional[int]]], List[List[StringPos]]]:
+        # Fills both tables in one pass over the bounds, allocating
+        # string positions only for the equivalents themselves.
+        note_table: List[List[Optional[int]]] = []
+        equivs_table: List[List[StringPos]] = [[] for _ in range(constants.MIDI_NUM_NOTES)]
         if self._bounds is not None:
-            for str_pos in self._bounds:
-                if str_pos.str_index < 0 or str_pos.str_index >= len(self._tuning):
-                    pass
+            frets = range(self._bounds.low.fret, self._bounds.high.fret + 1)
+            for str_index in range(self._bounds.low.str_index, self._bounds.high.str_index + 1):
+                if str_index < 0 or str_index >= len(self._tuning):
+                    note_table.append([None] * self._num_frets)
                 else:
-                    lookup[str_pos] = self._tuning[str_pos.str_index] + str_pos.fret
-        return lookup
-
-    def _make_equivs_lookup(self) -> Dict[int, List[StringPos]]:
-        lookup: Dict[int, List[StringPos]] = {}
-        if self._bounds is not None:
-            for str_pos in self._bounds:
-                note = self.get_note(str_pos)
-                if note is not None:
-                    if note in lookup:
-                        lookup[note].append(str_pos)
-                    else:
-                        lookup[note] = [str_pos]
-        return lookup
+                    base = self._tuning[str_index]
+                    note_table.append([base + fret for fret in frets])
+                    for fret in frets:
+                        note = base + fret
+                        if note >= 0 and note < constants.MIDI_NUM_NOTES:
+                            equivs_table[note].append(StringPos(str_index=str_index, fret=fret))
+        return note_table, equivs_table
 
     def get_note(self, str_pos: StringPos) -> Optional[int]:
-        return self._note_lookup.get(str_pos)
+        row = str_pos.str_index - self._low_str_index
+        col = str_pos.fret - self._low_fret
+        if row >= 0 and row < len(self._note_table) and col >= 0 and col < self._num_frets:
+            return self._note_table[row][col]
+        else:
+            return None
 
     def get_note_group(self, str_pos: StringPos) -> Optional[NoteGroup]:
         note = self.get_note(str_pos)
         if note is None:
             return None
         else:
-            primary = str_pos if self._bounds is not None and str_pos in self._bounds else None
-            equivs = self._equivs_lookup[note] if note is not None and note in self._equivs_lookup else []
-            return NoteGroup(note, primary, equivs)
+            # Only positions within bounds have notes, so this is the primary
+            equivs = self._equivs_table[note] if note >= 0 and note < constants.MIDI_NUM_NOTES else []
+            return NoteGroup(note, str_pos, equivs)
 
 
 class NoteHandler(metaclass=ABCMeta):
     @abstractmethod
-    def trigger(self, fret_msg: FretboardMessage) -> List[FretboardMessage]:
+    def trigger(self, fret_msg: FretboardMessage) -> Sequence[FretboardMessage]:
         """
         Finger the given note and emit note on/offs.
         velocity == 0 <=> note off
         """
         raise NotImplementedError()
 
+    @abstractmethod
+    def clear(self) -> None:
+        """ Forget all fingered notes without emitting anything """
+        raise NotImplementedError()
+
 
 class NoteTracker:
     def __init__(self, chan_mapper: ChannelMapper) -> None:
         self._chan_mapper = chan_mapper
-        # Map from channel to set of notes
-        self._notemap: Dict[int, Set[int]] = {}
+        # Map from channel to bitmask of sounding notes (bit n <=> note n)
+        self._notemap: Dict[int, int] = {}
         self._vis: Dict[StringPos, VisState] = {}
 
+    def clear(self) -> None:
+        self._notemap.clear()
+        self._vis.clear()
+
     def is_enabled(self, str_pos: StringPos) -> bool:
         return self.get_vis(str_pos).enabled
 
     def get_vis(self, str_pos: StringPos) -> VisState:
-        vs = self._vis.get(str_pos)
-        if vs is None:
-            vs = VisState.Off
+        return self._vis.get(str_pos, VisState.Off)
+
+    def _set_vis(self, str_pos: StringPos, vs: VisState) -> None:
+        # Only lit positions are stored, so the map stays small
+        if vs == VisState.Off:
+            self._vis.pop(str_pos, None)
+        else:
             self._vis[str_pos] = vs
-        return vs
 
     def _record_note(self, msg: FrozenMessage) -> None:
         if is_note_on_msg(msg):
-            if msg.channel not in self._notemap:
-                self._notemap[msg.channel] = set()
-            self._notemap[msg.channel].add(msg.note)
+            self._notemap[msg.channel] = self._notemap.get(msg.channel, 0) | (1 << msg.note)
         elif is_note_off_msg(msg):
             notes = self._notemap.get(msg.channel)
             if notes is not None:
-                notes.remove(msg.note)
-
-    def record_fx(self, msgs: List[FretboardMessage]) -> NoteEffects:
-        dirty: Set[StringPos] = set()
+                self._notemap[msg.channel] = notes & ~(1 << msg.note)
+
+    def record_fx(self, msgs: Sequence[FretboardMessage]) -> NoteEffects:
+        if len(msgs) == 0:
+            return NoteEffects.empty()
+        # Final vis of every position touched by these messages
+        vis: Dict[StringPos, VisState] = {}
+        out_msgs: List[FrozenMessage] = []
         for msg in msgs:
-            dirty.add(msg.str_pos)
+            str_pos = msg.str_pos
             active = msg.is_note_on()
             vs = VisState.OnPrimary if active else VisState.Off
-            self._vis[msg.str_pos] = vs
+            self._set_vis(str_pos, vs)
+            vis[str_pos] = vs
             for equiv in msg.equivs:
-                if equiv == msg.str_pos:
+                if equiv == str_pos:
                     continue
-                dirty.add(equiv)
+                cur_vis = self.get_vis(equiv)
                 channel = self._chan_mapper.map_channel(equiv)
-                if channel is not None:
-                    cur_vis = self.get_vis(equiv)
-                    if not cur_vis.primary:
-                        ws: VisState
-                        if active:
-                            if channel == msg.channel:
-                                ws = VisState.OnDisabled
-                            else:
-                                ws = VisState.OnLinked
+                if channel is not None and not cur_vis.primary:
+                    ws: VisState
+                    if active:
+                        if channel == msg.channel:
+                            ws = VisState.OnDisabled
                         else:
-                            ws = VisState.Off
-                        self._vis[equiv] = ws
+                            ws = VisState.OnLinked
+                    else:
+                        ws = VisState.Off
+                    self._set_vis(equiv, ws)
+                    vis[equiv] = ws
+                else:
+                    vis[equiv] = cur_vis
             self._record_note(msg.msg)
-        vis = {sp: vs for sp, vs in self._vis.items() if sp in dirty}
-        return NoteEffects(vis, msgs)
+            out_msgs.append(msg.msg)
+        return NoteEffects(vis, out_msgs)
 
     def clean_fx(self) -> NoteEffects:
-        default = VisState.Off
-        vis = {sp: default for sp, vs in self._vis.items() if not vs == VisState.Off}
-        msgs = [
-            FrozenMessage(type='note_on', channel=chan, note=note, velocity=0)
-            for chan, notes in self._notemap.items() for note in notes
-        ]
+        # Only lit positions are stored, so turn them all off
+        vis = {sp: VisState.Off for sp in self._vis}
+        msgs: List[FrozenMessage] = []
+        for chan, notes in self._notemap.items():
+            # Walk set bits from lowest to highest note
+            while notes:
+                low_bit = notes & -notes
+                msgs.append(make_note_off_msg(chan, low_bit.bit_length() - 1))
+                notes ^= low_bit
+        if len(vis) == 0 and len(msgs) == 0:
+            return NoteEffects.empty()
         return NoteEffects(vis, msgs)
 
 
 class PolyNoteHandler(NoteHandler):
-    def trigger(self, fret_msg: FretboardMessage) -> List[FretboardMessage]:
-        return [fret_msg]
+    def trigger(self, fret_msg: FretboardMessage) -> Sequence[FretboardMessage]:
+        # A tuple is cheaper to build than a list and is never mutated
+        return (fret_msg,)
+
+    def clear(self) -> None:
+        pass
 
 
 class MonoNoteHandler(NoteHandler):
     def __init__(self) -> None:
         self._last_off: Optional[FretboardMessage] = None
 
-    def trigger(self, fret_msg: FretboardMessage) -> List[FretboardMessage]:
-        msgs: List[FretboardMessage] = []
+    def trigger(self, fret_msg: FretboardMessage) -> Sequence[FretboardMessage]:
+        last_off = self._last_off
         if fret_msg.is_note_off():
-            if self._last_off is not None and self._last_off == fret_msg:
-                msgs.append(self._last_off)
+            if last_off is not None and last_off == fret_msg:
                 self._last_off = None
+                return (last_off,)
+            else:
+                # Release of a note that is no longer sounding (ignore)
+                return ()
         else:
-            if self._last_off is not None:
-                msgs.append(self._last_off)
-            msgs.append(fret_msg)
             self._last_off = fret_msg.make_note_off_msg()
-        return msgs
+            if last_off is None:
+                return (fret_msg,)
+            else:
+                return (last_off, fret_msg)
 
+    def clear(self) -> None:
+        self._last_off = None
 
-@dataclass(frozen=True)
+
+@dataclass
 class ChokeGroup:
-    note_order: List[int]
+    __slots__ = ('note_info', 'top')
+
     note_info: Dict[int, FretboardMessage]
+    # Message for the highest fingered note (None when nothing is fingered)
+    top: Optional[FretboardMessage]
 
     @classmethod
     def empty(cls) -> 'ChokeGroup':
-        return cls(note_order=[], note_info={})
+        return cls(note_info={}, top=None)
 
     def max_msg(self) -> Optional[FretboardMessage]:
-        max_note = self.note_order[-1] if len(self.note_order) > 0 else None
-        return self.note_info[max_note] if max_note is not None else None
+        return self.top
 
-    def trigger(self, fret_msg: FretboardMessage) -> None:
-        note_index = bisect_left(self.note_order, fret_msg.note)
-        note_exists = len(self.note_order) > note_index and note_index >= 0 and self.note_order[note_index] == fret_msg.note
+    def trigger(self, fret_msg: FretboardMessage) -> Tuple[Optional[FretboardMessage], Optional[FretboardMessage]]:
+        """ Finger or release a note, returning the top message before and after """
+        prev_top = self.top
+        note = fret_msg.note
         if fret_msg.is_note_on():
-            if not note_exists:
-                self.note_order.insert(note_index, fret_msg.note)
-            self.note_info[fret_msg.note] = fret_msg
-        else:
-            if note_exists:
-                del self.note_order[note_index]
-            if fret_msg.note in self.note_info:
-                del self.note_info[fret_msg.note]
+            self.note_info[note] = fret_msg
+            if prev_top is None or note >= prev_top.note:
+                self.top = fret_msg
+        elif note in self.note_info:
+            del self.note_info[note]
+            if prev_top is not None and note == prev_top.note:
+                self.top = self.note_info[max(self.note_info)] if len(self.note_info) > 0 else None
+        return prev_top, self.top
+
+    def clear(self) -> None:
+        self.note_info.clear()
+        self.top = None
 
 
 class ChokeNoteHandler(NoteHandler):
     def __init__(self, num_strings: int) -> None:
         self._fingered = [ChokeGroup.empty() for i in range(num_strings)]
 
-    def trigger(self, fret_msg: FretboardMessage) -> List[FretboardMessage]:
-        # Lookup choke group and find prev max note
+    def trigger(self, fret_msg: FretboardMessage) -> Sequence[FretboardMessage]:
+        # Add note to choke group and find prev and cur max notes
         group = self._fingered[fret_msg.str_pos.str_index]
-        prev_msg = group.max_msg()
-
-        # Add note to group and find cur max note
-        group.trigger(fret_msg)
-        cur_msg = group.max_msg()
+        prev_msg, cur_msg = group.trigger(fret_msg)
 
         # Return note on/offs
-        out_msgs: List[FretboardMessage] = []
-        if cur_msg is None:
-            if prev_msg is None:
-                # No notes - huh? (ignore)
-                pass
-            else:
-                # Single note mute - send off for prev
-                out_msgs.append(prev_msg.make_note_off_msg())
+        # Identity covers the cached messages, equality covers equal copies
+        if cur_msg is prev_msg or cur_msg == prev_msg:
+            # No notes, or movement above fretted string (ignore)
+            return ()
+        elif cur_msg is None:
+            # Single note mute - send off for prev
+            assert prev_msg is not None
+            return (prev_msg.make_note_off_msg(),)
+        elif prev_msg is None:
+            # Single note pluck - send on for cur
+            return (cur_msg,)
         else:
-            if prev_msg is None:
-                # Single note pluck - send on for cur
-                out_msgs.append(cur_msg)
-            else:
-                if prev_msg == cur_msg:
-                    # Movement above fretted string (ignore)
-                    pass
-                else:
-                    # Hammer-on or pull-off
-                    # Send on before off to maintain overlap for envelopes?
-                    out_msgs.append(cur_msg)
-                    out_msgs.append(prev_msg.make_note_off_msg())
-        return out_msgs
+            # Hammer-on or pull-off
+            # Send on before off to maintain overlap for envelopes?
+            return (cur_msg, prev_msg.make_note_off_msg())
+
+    def clear(self) -> None:
+        for group in self._fingered:
+            group.clear()
 
 
 @dataclass(frozen=True)
@@ -367,11 +445,12 @@ class BoundedConfig:
 class FretboardConfig(MappedComponentConfig[BoundedConfig]):
     chan_mode: ChannelMode
     play_mode: PlayMode
-    tuning: List[int]
+    tuning: Tuple[int, ...]
     min_velocity: int
     bounds: Optional[StringBounds]
 
     @classmethod
+    @lru_cache(maxsize=4)
     def extract(cls, root_config: BoundedConfig) -> 'FretboardConfig':
         return FretboardConfig(
             chan_mode=root_config.config.chan_mode,
@@ -382,6 +461,14 @@ class FretboardConfig(MappedComponentConfig[BoundedConfig]):
         )
 
 
+# The parts of the config that determine the tuner
+TunerKey = Tuple[Tuple[int, ...], Optional[StringBounds]]
+
+
+def tuner_key(config: FretboardConfig) -> TunerKey:
+    return (config.tuning, config.bounds)
+
+
 def create_tuner(config: FretboardConfig) -> Tuner:
     return FixedTuner(config.tuning, config.bounds)
 
@@ -423,8 +510,33 @@ class Fretboard(MappedComponent[BoundedConfig, FretboardConfig, NoteEffects]):
         super().__init__(config)
         self._mapper = create_chan_mapper(config)
         self._tracker = NoteTracker(self._mapper)
+        self._tuner_key = tuner_key(config)
         self._tuner = create_tuner(config)
+        # The previously active tuner, kept for quick toggling between two configs
+        self._prev_tuner_key: Optional[TunerKey] = None
+        self._prev_tuner: Optional[Tuner] = None
         self._handler = create_handler(config, self._tuner)
+        # Fretted messages by position and raw velocity, valid for the current config
+        self._fret_msgs: Dict[Tuple[StringPos, int], Optional[FretboardMessage]] = {}
+        self._bind_methods()
+
+    def _bind_methods(self) -> None:
+        # Bind the per-event methods of the current tracker and handler
+        # so trigger does not look them up on every event
+        self._is_enabled = self._tracker.is_enabled
+        self._record_fx = self._tracker.record_fx
+        self._handle_fret_msg = self._handler.trigger
+
+    def _update_tuner(self, config: FretboardConfig) -> None:
+        key = tuner_key(config)
+        if key == self._tuner_key:
+            return
+        elif self._prev_tuner is not None and key == self._prev_tuner_key:
+            self._tuner, self._prev_tuner = self._prev_tuner, self._tuner
+            self._tuner_key, self._prev_tuner_key = key, self._tuner_key
+        else:
+            self._prev_tuner, self._prev_tuner_key = self._tuner, self._tuner_key
+            self._tuner, self._tuner_key = create_tuner(config), key
 
     def _clamp_velocity(self, velocity: int) -> int:
         if velocity == 0:
@@ -438,30 +550,47 @@ class Fretboard(MappedComponent[BoundedConfig, FretboardConfig, NoteEffects]):
     def get_vis(self, str_pos: StringPos) -> VisState:
         return self._tracker.get_vis(str_pos)
 
+    def _make_fret_msg(self, str_pos: StringPos, velocity: int) -> Optional[FretboardMessage]:
+        note_group = self._tuner.get_note_group(str_pos)
+        channel = self._mapper.map_channel(str_pos)
+        if note_group is None or channel is None:
+            return None
+        else:
+            return FretboardMessage(
+                str_pos=str_pos,
+                equivs=note_group.equivs,
+                msg=make_note_on_msg(channel, note_group.note, self._clamp_velocity(velocity))
+            )
+
     def trigger(self, str_pos: StringPos, velocity: int) -> NoteEffects:
-        if self._tracker.is_enabled(str_pos):
-            note_group = self._tuner.get_note_group(str_pos)
-            channel = self._mapper.map_channel(str_pos)
-            if note_group is not None and channel is not None:
-                velocity = self._clamp_velocity(velocity)
-                fret_msg = FretboardMessage(
-                    str_pos=str_pos,
-                    equivs=note_group.equivs,
-                    msg=FrozenMessage(
-                        type='note_on',
-                        channel=channel,
-                        note=note_group.note,
-                        velocity=velocity
-                    )
-                )
-                out_msgs = self._handler.trigger(fret_msg)
-                return self._tracker.record_fx(out_msgs)
+        if self._is_enabled(str_pos):
+            # Repeated notes reuse the same immutable message
+            key = (str_pos, velocity)
+            if key in self._fret_msgs:
+                fret_msg = self._fret_msgs[key]
+            else:
+                fret_msg = self._make_fret_msg(str_pos, velocity)
+                self._fret_msgs[key] = fret_msg
+            if fret_msg is not None:
+                return self._record_fx(self._handle_fret_msg(fret_msg))
         return NoteEffects.empty()
 
     def handle_mapped_config(self, config: FretboardConfig) -> NoteEffects:
         fx = self._tracker.clean_fx()
-        self._mapper = create_chan_mapper(config)
-        self._tracker = NoteTracker(self._mapper)
-        self._tuner = create_tuner(config)
-        self._handler = create_handler(config, self._tuner)
+        old_config = self._config
+        self._config = config
+        # Keep the tracker and handler when their shape is unchanged,
+        # just forgetting the notes that were released above
+        if config.chan_mode == old_config.chan_mode:
+            self._tracker.clear()
+        else:
+            self._mapper = create_chan_mapper(config)
+            self._tracker = NoteTracker(self._mapper)
+        self._update_tuner(config)
+        if config.play_mode == old_config.play_mode and len(config.tuning) == len(old_config.tuning):
+            self._handler.clear()
+        else:
+            self._handler = create_handler(config, self._tuner)
+        self._fret_msgs.clear()
+        self._bind_methods()
         return fx
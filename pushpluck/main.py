@@ -1,18 +1,28 @@
 from argparse import ArgumentParser
+from contextlib import contextmanager
+from logging.handlers import QueueHandler, QueueListener
 from pushpluck import constants
 from pushpluck.config import default_scheme, init_config
 from pushpluck.menu import default_menu_layout
 from pushpluck.plucked import Plucked
-from pushpluck.push import match_event, push_ports_context, PushOutput, PushPorts
+from pushpluck.push import match_event, push_ports_context, warm_color_msgs, PushEvent, PushOutput, PushPorts
 from pushpluck.shadow import PushShadow
+from queue import SimpleQueue
+from typing import Generator, List
 
 import logging
 
 
+# Most inbound messages handled per loop turn
+MAX_RECV_BATCH = 32
+
+
 def main_with_ports(ports: PushPorts, min_velocity: int) -> None:
     scheme = default_scheme()
     layout = default_menu_layout()
     config = init_config(min_velocity)
+    # Pads are only ever painted with scheme colors
+    warm_color_msgs(scheme)
     push = PushOutput(ports.midi_out)
     shadow = PushShadow(push)
     # Start with a clean slate
@@ -24,10 +34,13 @@ def main_with_ports(ports: PushPorts, min_velocity: int) -> None:
         plucked.reset()
         logging.info('controller ready')
         while True:
-            msg = ports.midi_in.recv_msg()
-            event = match_event(msg)
-            if event is not None:
-                plucked.handle_event(event)
+            msgs = ports.midi_in.recv_msgs(MAX_RECV_BATCH)
+            events: List[PushEvent] = []
+            for msg in msgs:
+                event = match_event(msg)
+                if event is not None:
+                    events.append(event)
+            plucked.handle_events(events)
     except KeyboardInterrupt:
         pass
     finally:
@@ -49,24 +62,47 @@ def make_parser() -> ArgumentParser:
     return parser
 
 
-def configure_logging(log_level: str) -> None:
+class DeferredQueueHandler(QueueHandler):
+    """
+    Enqueues records as-is so that message formatting happens on the listener thread.
+    Log arguments must be safe to read from another thread (e.g. frozen messages).
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+@contextmanager
+def logging_context(log_level: str) -> Generator[None, None, None]:
+    # Format and write log lines on a background thread to keep stdout off the midi path
+    queue: 'SimpleQueue[logging.LogRecord]' = SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(
+        '%(asctime)s %(levelname)s %(filename)s:%(lineno)d -- %(message)s'
+    ))
+    listener = QueueListener(queue, stream_handler)
     logging.basicConfig(
-        format='%(asctime)s %(levelname)s %(filename)s:%(lineno)d -- %(message)s',
-        level=log_level
+        level=log_level,
+        handlers=[DeferredQueueHandler(queue)]
     )
+    listener.start()
+    try:
+        yield
+    finally:
+        listener.stop()
 
 
 def main():
     parser = make_parser()
     args = parser.parse_args()
-    configure_logging(args.log_level)
-    with push_ports_context(
-        push_port_name=args.push_port,
-        processed_port_name=args.processed_port,
-        delay=args.push_delay
-    ) as ports:
-        main_with_ports(ports, args.min_velocity)
-    logging.info('done')
+    with logging_context(args.log_level):
+        with push_ports_context(
+            push_port_name=args.push_port,
+            processed_port_name=args.processed_port,
+            delay=args.push_delay
+        ) as ports:
+            main_with_ports(ports, args.min_velocity)
+        logging.info('done')
 
 
 if __name__ == '__main__':
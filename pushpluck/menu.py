@@ -377,6 +377,7 @@ class Menu:
         return self._state.config
 
     def handle_event(self, push: PushInterface, event: PushEvent) -> Optional[Config]:
+        old_config = self._state.config
         updated = False
         if isinstance(event, ButtonEvent):
             if event.pressed:
@@ -422,9 +423,11 @@ class Menu:
 
         if updated:
             self._state.redraw(push)
-            return self._state.config
-        else:
-            return None
+            new_config = self._state.config
+            # Only report configs that changed (page switches, for example, do not)
+            if new_config is not old_config and new_config != old_config:
+                return new_config
+        return None
 
     def redraw(self, push: PushInterface) -> None:
         self._state.redraw(push)
@@ -3,16 +3,21 @@ from mido import Message
 from mido.frozen import freeze_message, FrozenMessage
 from mido.ports import BaseInput, BaseOutput
 from pushpluck.base import Closeable, Resettable
-from queue import SimpleQueue
-from typing import Optional
+from queue import Empty, SimpleQueue
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 
 import logging
 import mido
+import threading
 import time
 
 
+# Message types that carry a note and velocity
+NOTE_MSG_TYPES = frozenset(('note_on', 'note_off'))
+
+
 def is_note_msg(msg: FrozenMessage) -> bool:
-    return msg.type == 'note_on' or msg.type == 'note_off'
+    return msg.type in NOTE_MSG_TYPES
 
 
 def is_note_on_msg(msg: FrozenMessage) -> bool:
@@ -23,6 +28,45 @@ def is_note_off_msg(msg: FrozenMessage) -> bool:
     return (msg.type == 'note_on' and msg.velocity == 0) or msg.type == 'note_off'
 
 
+# Template whose attributes are copied into trusted note messages
+_NOTE_ON_PROTO = FrozenMessage(type='note_on', channel=0, note=0, velocity=0)
+
+
+def make_note_on_msg(channel: int, note: int, velocity: int) -> FrozenMessage:
+    """
+    Build a note on without mido's per-field validation,
+    checking only the ranges (with the same ValueError mido raises).
+    """
+    if not 0 <= channel < 16:
+        raise ValueError(f'channel must be in range 0..15: {channel}')
+    if not 0 <= note < 128:
+        raise ValueError(f'note must be in range 0..127: {note}')
+    if not 0 <= velocity < 128:
+        raise ValueError(f'velocity must be in range 0..127: {velocity}')
+    msg = object.__new__(FrozenMessage)
+    # Frozen messages reject setattr, so fill in the attribute dict directly
+    attrs = vars(msg)
+    attrs.update(vars(_NOTE_ON_PROTO))
+    attrs['channel'] = channel
+    attrs['note'] = note
+    attrs['velocity'] = velocity
+    return msg
+
+
+# Frozen note-off messages are shared across sends, keyed by channel and note
+_NOTE_OFF_MSGS: Dict[Tuple[int, int], FrozenMessage] = {}
+
+
+def make_note_off_msg(channel: int, note: int) -> FrozenMessage:
+    """ Note off as a zero-velocity note on, like the rest of the note path """
+    key = (channel, note)
+    msg = _NOTE_OFF_MSGS.get(key)
+    if msg is None:
+        msg = make_note_on_msg(channel, note, 0)
+        _NOTE_OFF_MSGS[key] = msg
+    return msg
+
+
 class MidiSource(metaclass=ABCMeta):
     @abstractmethod
     def recv_msg(self) -> FrozenMessage:
@@ -34,6 +78,10 @@ class MidiSink(metaclass=ABCMeta):
     def send_msg(self, msg: FrozenMessage) -> None:
         raise NotImplementedError()
 
+    def send_msgs(self, msgs: Iterable[FrozenMessage]) -> None:
+        for msg in msgs:
+            self.send_msg(msg)
+
 
 class MidiInput(MidiSource, Closeable):
     @classmethod
@@ -65,6 +113,20 @@ class MidiInput(MidiSource, Closeable):
         logging.debug('Received message from %s: %s', self._in_port_name, msg)
         return msg
 
+    def recv_msgs(self, max_msgs: int) -> List[FrozenMessage]:
+        # Block for the first message, then drain whatever else has arrived
+        mut_msgs = [self._queue.get()]
+        while len(mut_msgs) < max_msgs:
+            try:
+                mut_msgs.append(self._queue.get_nowait())
+            except Empty:
+                break
+        msgs = [freeze_message(mut_msg) for mut_msg in mut_msgs]
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            for msg in msgs:
+                logging.debug('Received message from %s: %s', self._in_port_name, msg)
+        return msgs
+
 
 class MidiOutput(MidiSink, Resettable, Closeable):
     @classmethod
@@ -110,3 +172,82 @@ class MidiOutput(MidiSink, Resettable, Closeable):
                 self._last_sent = now
         logging.debug('Sending message to %s: %s', self._out_port_name, msg)
         self._out_port.send(msg)
+
+    def send_msgs(self, msgs: Iterable[FrozenMessage]) -> None:
+        # Same pacing as send_msg, but the clock is only read again after
+        # a sleep, so sends that are already due skip the clock entirely.
+        debug = logging.getLogger().isEnabledFor(logging.DEBUG)
+        send = self._out_port.send
+        delay = self._delay
+        now = time.monotonic() if delay is not None else 0.0
+        last_sent = self._last_sent
+        for msg in msgs:
+            if delay is not None:
+                lim = last_sent + delay
+                if lim > now:
+                    time.sleep(lim - now)
+                    # Oversleep counts towards the next gap, as in send_msg
+                    now = time.monotonic()
+                    last_sent = lim
+                else:
+                    last_sent = now
+            if debug:
+                logging.debug('Sending message to %s: %s', self._out_port_name, msg)
+            send(msg)
+        self._last_sent = last_sent
+
+
+class QueuedMidiOutput(MidiOutput):
+    """
+    Paces and sends messages on a background thread so that callers
+    never sleep on the output delay. Messages keep their send order.
+    """
+
+    def __init__(
+        self,
+        out_port_name: str,
+        out_port: BaseOutput,
+        delay: Optional[float]
+    ) -> None:
+        super().__init__(out_port_name=out_port_name, out_port=out_port, delay=delay)
+        # Messages to send, events to set once everything before them is sent,
+        # or None to stop the sender
+        self._queue: 'SimpleQueue[Union[FrozenMessage, threading.Event, None]]' = SimpleQueue()
+        self._sender = threading.Thread(target=self._run_sender, name=f'send {out_port_name}', daemon=True)
+        self._sender.start()
+
+    def _run_sender(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            elif isinstance(item, threading.Event):
+                item.set()
+            else:
+                try:
+                    super().send_msg(item)
+                except Exception:
+                    logging.exception('Failed to send message to %s: %s', self._out_port_name, item)
+
+    def send_msg(self, msg: FrozenMessage) -> None:
+        self._queue.put_nowait(msg)
+
+    def send_msgs(self, msgs: Iterable[FrozenMessage]) -> None:
+        put = self._queue.put_nowait
+        for msg in msgs:
+            put(msg)
+
+    def flush(self) -> None:
+        """ Block until everything queued so far has been sent """
+        sent = threading.Event()
+        self._queue.put_nowait(sent)
+        sent.wait()
+
+    def reset(self) -> None:
+        self.flush()
+        super().reset()
+
+    def close(self) -> None:
+        self._queue.put_nowait(None)
+        self._sender.join()
+        super().close()
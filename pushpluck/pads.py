@@ -1,13 +1,14 @@
 from dataclasses import dataclass
+from pushpluck import constants
 from pushpluck.config import ColorScheme, Config, NoteType, PadColorMapper, VisState
 from pushpluck.color import Color
 from pushpluck.fretboard import BoundedConfig, Fretboard, NoteEffects
-from pushpluck.pos import Pos
+from pushpluck.pos import ALL_POS, Pos
 from pushpluck.push import PadEvent, PushInterface
 from pushpluck.midi import MidiSink
-from pushpluck.scale import NoteName, Scale, ScaleClassifier, name_and_octave_from_note
+from pushpluck.scale import MAX_NOTES, NoteName, Scale, ScaleClassifier
 from pushpluck.viewport import Viewport
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 
 
 @dataclass(frozen=True)
@@ -24,21 +25,51 @@ class PadsConfig:
 
 
 @dataclass
-class SinglePadState:
-    mapper: PadColorMapper
-    vis: VisState
+class PadsState:
+    # Parallel per-pad lists, indexed by pad index (see Pos.to_index)
+    mappers: List[PadColorMapper]
+    vis: List[VisState]
+    # Mapper colors for each vis state (see PadColorMapper.resolve)
+    colors: List[Tuple[Optional[Color], ...]]
 
-    def color(self, scheme: ColorScheme) -> Optional[Color]:
-        return self.mapper.get_color(scheme, self.vis)
+    @classmethod
+    def default(cls, scheme: ColorScheme) -> 'PadsState':
+        mapper = PadColorMapper.misc(False)
+        colors = mapper.resolve(scheme)
+        return cls(
+            mappers=[mapper] * constants.NUM_PADS,
+            vis=[VisState.Off] * constants.NUM_PADS,
+            colors=[colors] * constants.NUM_PADS
+        )
 
+    def set_mapper(self, index: int, mapper: PadColorMapper, colors: Tuple[Optional[Color], ...]) -> None:
+        self.mappers[index] = mapper
+        self.colors[index] = colors
 
-@dataclass
-class PadsState:
-    lookup: Dict[Pos, SinglePadState]
+    def clear_vis(self) -> None:
+        self.vis[:] = [VisState.Off] * constants.NUM_PADS
 
-    @classmethod
-    def default(cls) -> 'PadsState':
-        return cls({pos: SinglePadState(PadColorMapper.misc(False), VisState.Off) for pos in Pos.iter_all()})
+
+_ROOT_MAPPER = PadColorMapper.note(NoteType.Root)
+_MEMBER_MAPPER = PadColorMapper.note(NoteType.Member)
+_OTHER_MAPPER = PadColorMapper.note(NoteType.Other)
+
+
+def _note_mappers_by_offset(classifier: ScaleClassifier) -> Tuple[PadColorMapper, ...]:
+    # Pad colors only depend on note name, so classify each of the 12 once
+    # by testing the offset's bit in the scale masks
+    root_mask = classifier.root_mask
+    member_mask = classifier.member_mask
+    mappers: List[PadColorMapper] = []
+    for offset in range(MAX_NOTES):
+        bit = 1 << offset
+        if root_mask & bit:
+            mappers.append(_ROOT_MAPPER)
+        elif member_mask & bit:
+            mappers.append(_MEMBER_MAPPER)
+        else:
+            mappers.append(_OTHER_MAPPER)
+    return tuple(mappers)
 
 
 class Pads:
@@ -66,26 +97,22 @@ class Pads:
         self._config = config
         self._fretboard = fretboard
         self._viewport = viewport
-        self._state = PadsState.default()
+        self._state = PadsState.default(scheme)
+        # Resolved colors for each mapper seen so far (the scheme is fixed)
+        self._mapper_colors: Dict[PadColorMapper, Tuple[Optional[Color], ...]] = {}
         self._reset_pad_colors()
 
-    def _get_pad_color(self, pos: Pos) -> Optional[Color]:
-        pad = self._state.lookup[pos]
-        return pad.color(self._scheme)
-
-    def _redraw_pos(self, push: PushInterface, pos: Pos):
-        color = self._get_pad_color(pos)
-        if color is None:
-            push.pad_led_off(pos)
-        else:
-            push.pad_set_color(pos, color)
-
     def redraw(self, push: PushInterface) -> None:
-        for pos in Pos.iter_all():
-            self._redraw_pos(push, pos)
+        pad_led_off = push.pad_led_off
+        pad_set_color = push.pad_set_color
+        for pos, colors, vis in zip(ALL_POS, self._state.colors, self._state.vis):
+            color = colors[vis.index]
+            if color is None:
+                pad_led_off(pos)
+            else:
+                pad_set_color(pos, color)
 
-    def _make_pad_color_mapper(self, classifier: ScaleClassifier, pos: Pos) -> PadColorMapper:
-        mapper: PadColorMapper
+    def _make_pad_color_mapper(self, note_mappers: Tuple[PadColorMapper, ...], pos: Pos) -> PadColorMapper:
         str_pos = self._viewport.str_pos_from_pad_pos(pos)
         if str_pos is None:
             return PadColorMapper.misc(False)
@@ -94,21 +121,20 @@ class Pads:
             if note is None:
                 return PadColorMapper.misc(False)
             else:
-                name, _ = name_and_octave_from_note(note)
-                note_type: NoteType
-                if classifier.is_root(name):
-                    note_type = NoteType.Root
-                elif classifier.is_member(name):
-                    note_type = NoteType.Member
-                else:
-                    note_type = NoteType.Other
-                return PadColorMapper.note(note_type)
+                return note_mappers[note % MAX_NOTES]
 
     def _reset_pad_colors(self) -> None:
-        classifier = self._config.scale.to_classifier(self._config.root)
-        for pos in Pos.iter_all():
-            mapper = self._make_pad_color_mapper(classifier, pos)
-            self._state.lookup[pos].mapper = mapper
+        note_mappers = _note_mappers_by_offset(self._config.scale.to_classifier(self._config.root))
+        for pos in ALL_POS:
+            mapper = self._make_pad_color_mapper(note_mappers, pos)
+            self._state.set_mapper(pos.to_index(), mapper, self._resolve_colors(mapper))
+
+    def _resolve_colors(self, mapper: PadColorMapper) -> Tuple[Optional[Color], ...]:
+        colors = self._mapper_colors.get(mapper)
+        if colors is None:
+            colors = mapper.resolve(self._scheme)
+            self._mapper_colors[mapper] = colors
+        return colors
 
     def handle_event(self, push: PushInterface, sink: MidiSink, event: PadEvent) -> None:
         str_pos = self._viewport.str_pos_from_pad_pos(event.pos)
@@ -125,22 +151,34 @@ class Pads:
         bounded_config = BoundedConfig(bounds, root_config)
         fx = self._fretboard.handle_config(bounded_config, reset)
         if fx is not None:
-            self._handle_note_effects(push, sink, fx)
+            if len(fx.msgs) > 0:
+                sink.send_msgs(fx.msgs)
+            # Every note is released, and the viewport may have moved already,
+            # so turn off all pads instead of mapping the note-offs to pads
+            self._state.clear_vis()
             # If there are note-offs or updated config, force reset and redraw of pads
             reset = True
         config = PadsConfig.extract(root_config)
-        if config != self._config or reset:
+        if reset or (config is not self._config and config != self._config):
             self._config = config
             self._reset_pad_colors()
             self.redraw(push)
 
     def _handle_note_effects(self, push: PushInterface, sink: MidiSink, fx: NoteEffects) -> None:
         # Send notes
-        for fret_msg in fx.msgs:
-            sink.send_msg(fret_msg.msg)
+        if len(fx.msgs) > 0:
+            sink.send_msgs(fx.msgs)
         # Update display
+        pad_pos_from_str_pos = self._viewport.pad_pos_from_str_pos
+        pad_vis = self._state.vis
+        pad_colors = self._state.colors
         for sp, vis in fx.vis.items():
-            pad_pos = self._viewport.pad_pos_from_str_pos(sp)
+            pad_pos = pad_pos_from_str_pos(sp)
             if pad_pos is not None:
-                self._state.lookup[pad_pos].vis = vis
-                self._redraw_pos(push, pad_pos)
+                index = pad_pos.to_index()
+                pad_vis[index] = vis
+                color = pad_colors[index][vis.index]
+                if color is None:
+                    push.pad_led_off(pad_pos)
+                else:
+                    push.pad_set_color(pad_pos, color)
@@ -6,6 +6,7 @@ from pushpluck.midi import MidiSink
 from pushpluck.pads import Pads
 from pushpluck.push import ButtonEvent, PadEvent, PushEvent
 from pushpluck.shadow import PushShadow
+from typing import List, Sequence
 
 import logging
 
@@ -25,19 +26,39 @@ class Plucked(Resettable):
         self._menu = Menu(layout, config)
 
     def handle_event(self, event: PushEvent) -> None:
-        with self._shadow.context() as push:
-            if isinstance(event, PadEvent):
-                self._pads.handle_event(push, self._midi_processed, event)
-            elif isinstance(event, ButtonEvent) and event.button == ButtonCC.Undo:
+        self.handle_events([event])
+
+    def handle_events(self, events: Sequence[PushEvent]) -> None:
+        # Consecutive events share one shadow context so their changes are
+        # emitted together. Undo and master reset the shadow themselves,
+        # so the pending batch is flushed before handling them.
+        batch: List[PushEvent] = []
+        for event in events:
+            if isinstance(event, ButtonEvent) and event.button == ButtonCC.Undo:
+                self._handle_batch(batch)
+                batch = []
                 if event.pressed:
                     self.reset()
             elif isinstance(event, ButtonEvent) and event.button == ButtonCC.Master:
+                self._handle_batch(batch)
+                batch = []
                 if event.pressed:
                     self.redraw()
             else:
-                config = self._menu.handle_event(push, event)
-                if config is not None:
-                    self._pads.handle_config(push, self._midi_processed, config, reset=False)
+                batch.append(event)
+        self._handle_batch(batch)
+
+    def _handle_batch(self, events: List[PushEvent]) -> None:
+        if len(events) == 0:
+            return
+        with self._shadow.context() as push:
+            for event in events:
+                if isinstance(event, PadEvent):
+                    self._pads.handle_event(push, self._midi_processed, event)
+                else:
+                    config = self._menu.handle_event(push, event)
+                    if config is not None:
+                        self._pads.handle_config(push, self._midi_processed, config, reset=False)
 
     def redraw(self) -> None:
         logging.info('plucked redrawing')
@@ -48,7 +69,12 @@ class Plucked(Resettable):
 
     def reset(self) -> None:
         logging.info('plucked resetting')
-        self._shadow.reset()
+        # Blank the shadowed state within the context rather than resetting the
+        # push itself, so only the pads, buttons, and text that differ from
+        # the freshly drawn state are sent. Master still forces a full redraw.
         with self._shadow.context() as push:
+            push.lcd_reset()
+            push.button_reset()
+            push.pad_reset()
             config = self._menu.handle_reset(push)
             self._pads.handle_config(push, self._midi_processed, config, reset=True)
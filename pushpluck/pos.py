@@ -1,44 +1,87 @@
-from dataclasses import dataclass
+from dataclasses import FrozenInstanceError, dataclass
 from pushpluck import constants
-from typing import Generator, Optional
+from pushpluck.base import FrozenSlots
+from typing import Any, Generator, Iterator, Optional, Tuple
 
 
-@dataclass(frozen=True)
-class Pos:
+class Pos(FrozenSlots):
     """
     (0,0) is bottom left corner (lowest note)
     (7,7) is top right corner (highest note)
     """
 
+    # Immutable and slotted by hand (rather than a frozen dataclass) so the
+    # derived index and note can be stored alongside row and col.
+    __slots__ = ('row', 'col', '_index', '_note')
+
     row: int
     col: int
+    _index: int
+    _note: int
+
+    def __init__(self, row: int, col: int) -> None:
+        index = constants.NUM_PAD_COLS * row + col
+        object.__setattr__(self, 'row', row)
+        object.__setattr__(self, 'col', col)
+        object.__setattr__(self, '_index', index)
+        object.__setattr__(self, '_note', constants.LOW_NOTE + index)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise FrozenInstanceError(f'cannot assign to field {name!r}')
+
+    def __delattr__(self, name: str) -> None:
+        raise FrozenInstanceError(f'cannot delete field {name!r}')
+
+    def _init_args(self) -> Tuple[int, int]:
+        return (self.row, self.col)
+
+    def __repr__(self) -> str:
+        return f'Pos(row={self.row}, col={self.col})'
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Pos):
+            return NotImplemented
+        return self.row == other.row and self.col == other.col
+
+    def __hash__(self) -> int:
+        return self._index
 
     def __iter__(self) -> Generator[int, None, None]:
         yield self.row
         yield self.col
 
     def to_index(self) -> int:
-        return constants.NUM_PAD_COLS * self.row + self.col
+        return self._index
 
     def to_note(self) -> int:
-        return constants.LOW_NOTE + self.to_index()
+        return self._note
 
     @staticmethod
     def from_input_note(note: int) -> 'Optional[Pos]':
-        if note < constants.LOW_NOTE or note >= constants.HIGH_NOTE:
-            return None
+        # Bounds check first, since a negative note would index from the end
+        if 0 <= note < len(_POS_BY_NOTE):
+            return _POS_BY_NOTE[note]
         else:
-            index = note - constants.LOW_NOTE
-            row = index // constants.NUM_PAD_COLS
-            col = index % constants.NUM_PAD_COLS
-            return Pos(row=row, col=col)
+            return None
 
     @staticmethod
-    def iter_all() -> 'Generator[Pos, None, None]':
+    def iter_all() -> 'Iterator[Pos]':
         """ Iterator from lowest to highest pos """
-        for row in range(constants.NUM_PAD_ROWS):
-            for col in range(constants.NUM_PAD_COLS):
-                yield Pos(row, col)
+        return iter(ALL_POS)
+
+
+# Interned pad positions, from lowest to highest (indexed by Pos.to_index)
+ALL_POS: Tuple[Pos, ...] = tuple(
+    Pos(row, col)
+    for row in range(constants.NUM_PAD_ROWS)
+    for col in range(constants.NUM_PAD_COLS)
+)
+
+# Pad position for every midi note number, or None outside the pad range
+_POS_BY_NOTE: Tuple[Optional[Pos], ...] = tuple(
+    ALL_POS[note - constants.LOW_NOTE] if constants.LOW_NOTE <= note < constants.HIGH_NOTE else None
+    for note in range(constants.MIDI_NUM_NOTES)
+)
 
 
 @dataclass(frozen=True)
@@ -57,9 +100,13 @@ class ChanSelPos:
             return ChanSelPos(col)
 
     @staticmethod
-    def iter_all() -> 'Generator[ChanSelPos, None, None]':
-        for col in range(constants.NUM_PAD_COLS):
-            yield ChanSelPos(col)
+    def iter_all() -> 'Iterator[ChanSelPos]':
+        """ Iterator from lowest to highest col """
+        return iter(ALL_CHAN_SEL_POS)
+
+
+# Interned channel select positions, from lowest to highest col
+ALL_CHAN_SEL_POS: Tuple[ChanSelPos, ...] = tuple(ChanSelPos(col) for col in range(constants.NUM_PAD_COLS))
 
 
 @dataclass(frozen=True)
@@ -78,6 +125,10 @@ class GridSelPos:
             return GridSelPos(col)
 
     @staticmethod
-    def iter_all() -> 'Generator[GridSelPos, None, None]':
-        for col in range(constants.NUM_PAD_COLS):
-            yield GridSelPos(col)
+    def iter_all() -> 'Iterator[GridSelPos]':
+        """ Iterator from lowest to highest col """
+        return iter(ALL_GRID_SEL_POS)
+
+
+# Interned grid select positions, from lowest to highest col
+ALL_GRID_SEL_POS: Tuple[GridSelPos, ...] = tuple(GridSelPos(col) for col in range(constants.NUM_PAD_COLS))
@@ -3,54 +3,133 @@ from contextlib import contextmanager
 from dataclasses import dataclass
 from mido.frozen import FrozenMessage
 from pushpluck import constants
-from pushpluck.base import Closeable, Resettable
+from pushpluck.base import Closeable, FrozenSlots, Resettable
 from pushpluck.color import COLORS, Color
 from pushpluck.constants import ButtonCC, ButtonColor, ButtonIllum, KnobCC, KnobGroup, TimeDivCC
-from pushpluck.midi import MidiInput, MidiOutput, is_note_msg
-from pushpluck.pos import ChanSelPos, GridSelPos, Pos
-from typing import Generator, List, Optional, Type, TypeVar
+from pushpluck.midi import NOTE_MSG_TYPES, MidiInput, MidiOutput, QueuedMidiOutput, is_note_msg
+from pushpluck.pos import ALL_POS, ChanSelPos, GridSelPos, Pos
+from typing import Callable, Dict, Generator, Iterable, List, Optional, Tuple, Type, TypeVar
 
 import logging
 import time
 
 
-def frame_sysex(raw_data: List[int]) -> FrozenMessage:
-    data: List[int] = []
-    data.extend(constants.PUSH_SYSEX_PREFIX)
-    data.extend(raw_data)
+_PUSH_SYSEX_PREFIX_BYTES = bytes(constants.PUSH_SYSEX_PREFIX)
+
+
+def frame_sysex(raw_data: Iterable[int]) -> FrozenMessage:
+    return FrozenMessage('sysex', data=_PUSH_SYSEX_PREFIX_BYTES + bytes(raw_data))
+
+
+def _make_color_templates() -> List[bytearray]:
+    templates: List[bytearray] = []
+    for index in range(constants.NUM_PADS):
+        template = bytearray(_PUSH_SYSEX_PREFIX_BYTES)
+        template.extend([4, 0, 8, index, 0, 0, 0, 0, 0, 0, 0])
+        templates.append(template)
+    return templates
+
+
+# Sysex color frames for each pad index, with color nibbles left zeroed
+_COLOR_TEMPLATES = _make_color_templates()
+
+
+def _build_color_msg(index: int, color: Color) -> FrozenMessage:
+    data = _COLOR_TEMPLATES[index][:]
+    red, green, blue = color.red, color.green, color.blue
+    data[8] = (red & 240) >> 4
+    data[9] = red & 15
+    data[10] = (green & 240) >> 4
+    data[11] = green & 15
+    data[12] = (blue & 240) >> 4
+    data[13] = blue & 15
     return FrozenMessage('sysex', data=data)
 
 
+# Frozen color messages are shared across sends, keyed by pad index and color
+_COLOR_MSG_CACHE: Dict[Tuple[int, Color], FrozenMessage] = {}
+
+
 def make_color_msg(pos: Pos, color: Color) -> FrozenMessage:
-    index = pos.to_index()
-    msb = [(x & 240) >> 4 for x in color]
-    lsb = [x & 15 for x in color]
-    raw_data = [4, 0, 8, index, 0, msb[0], lsb[0], msb[1], lsb[1], msb[2], lsb[2]]
-    return frame_sysex(raw_data)
+    key = (pos.to_index(), color)
+    msg = _COLOR_MSG_CACHE.get(key)
+    if msg is None:
+        msg = _build_color_msg(key[0], color)
+        _COLOR_MSG_CACHE[key] = msg
+    return msg
+
+
+def warm_color_msgs(colors: Iterable[Color]) -> None:
+    """ Build color messages for every pad up front so first paints are lookups """
+    for color in set(colors):
+        for index in range(constants.NUM_PADS):
+            key = (index, color)
+            if key not in _COLOR_MSG_CACHE:
+                _COLOR_MSG_CACHE[key] = _build_color_msg(index, color)
+
+
+# Frozen led messages are shared across sends, keyed by pad index and value
+_LED_MSG_CACHE: Dict[Tuple[int, int], FrozenMessage] = {}
 
 
 def make_led_msg(pos: Pos, value: int) -> FrozenMessage:
-    note = pos.to_note()
-    return FrozenMessage('note_on', note=note, velocity=value)
+    key = (pos.to_index(), value)
+    msg = _LED_MSG_CACHE.get(key)
+    if msg is None:
+        msg = FrozenMessage('note_on', note=pos.to_note(), velocity=value)
+        _LED_MSG_CACHE[key] = msg
+    return msg
+
+
+# Off messages for every button, in enum order
+_BUTTON_OFF_MSGS: Dict[ButtonCC, FrozenMessage] = {
+    button: FrozenMessage(type='control_change', control=button.value, value=0) for button in ButtonCC
+}
+
+
+# Led-off messages for every pad, from lowest to highest pos
+_PAD_RESET_MSGS: Tuple[FrozenMessage, ...] = tuple(make_led_msg(pos, 0) for pos in ALL_POS)
 
 
 def make_lcd_msg(row: int, offset: int, text: str) -> FrozenMessage:
-    raw_data = [27 - row, 0, len(text) + 1, offset]
-    for c in text:
-        raw_data.append(ord(c))
-    return frame_sysex(raw_data)
+    header = bytes((27 - row, 0, len(text) + 1, offset))
+    return frame_sysex(header + text.encode('ascii'))
+
+
+# A full line of spaces, written to clear each lcd row
+_BLANK_LCD_LINE = ' ' * constants.DISPLAY_MAX_LINE_LEN
+
+# Blank line messages for every lcd row, from top to bottom
+_LCD_RESET_MSGS: Tuple[FrozenMessage, ...] = tuple(
+    make_lcd_msg(row, 0, _BLANK_LCD_LINE) for row in range(constants.DISPLAY_MAX_ROWS)
+)
 
 
 E = TypeVar('E', bound='PushEvent')
 
 
 class PushEvent(metaclass=ABCMeta):
+    # Empty so that slotted subclasses don't get a per-instance dict
+    __slots__ = ()
+
     @classmethod
     @abstractmethod
     def match(cls: Type[E], msg: FrozenMessage) -> Optional[E]:
         raise NotImplementedError
 
 
+def _build_knob_table() -> Tuple[Optional[Tuple[KnobCC, KnobGroup, int]], ...]:
+    table: List[Optional[Tuple[KnobCC, KnobGroup, int]]] = [None] * constants.MIDI_NUM_CONTROLS
+    for control, knob in constants.KNOB_CC_VALUE_LOOKUP.items():
+        group, offset = constants.knob_group_and_offset(knob)
+        table[control] = (knob, group, offset)
+    return tuple(table)
+
+
+# Knob, group, and offset for every control number, or None if not a knob
+_KNOB_TABLE = _build_knob_table()
+
+
 @dataclass(frozen=True)
 class KnobEvent(PushEvent):
     knob: KnobCC
@@ -61,9 +140,9 @@ class KnobEvent(PushEvent):
     @classmethod
     def match(cls, msg: FrozenMessage) -> Optional['KnobEvent']:
         if msg.type == 'control_change':
-            knob = constants.KNOB_CC_VALUE_LOOKUP.get(msg.control)
-            if knob is not None:
-                group, offset = constants.knob_group_and_offset(knob)
+            entry = _KNOB_TABLE[msg.control]
+            if entry is not None:
+                knob, group, offset = entry
                 return cls(knob, group, offset, msg.value < 127)
         return None
 
@@ -76,14 +155,16 @@ class ButtonEvent(PushEvent):
     @classmethod
     def match(cls, msg: FrozenMessage) -> Optional['ButtonEvent']:
         if msg.type == 'control_change':
-            button = constants.BUTTON_CC_VALUE_LOOKUP.get(msg.control)
+            button = constants.BUTTON_CC_VALUE_TABLE[msg.control]
             if button is not None:
                 return cls(button, msg.value > 0)
         return None
 
 
 @dataclass(frozen=True)
-class PadEvent(PushEvent):
+class PadEvent(PushEvent, FrozenSlots):
+    __slots__ = ('pos', 'velocity')
+
     pos: Pos
     velocity: int
 
@@ -104,7 +185,7 @@ class TimeDivEvent(PushEvent):
     @classmethod
     def match(cls, msg: FrozenMessage) -> Optional['TimeDivEvent']:
         if msg.type == 'control_change':
-            time_div = constants.TIME_DIV_CC_VALUE_LOOKUP.get(msg.control)
+            time_div = constants.TIME_DIV_CC_VALUE_TABLE[msg.control]
             if time_div is not None:
                 return cls(time_div, msg.value > 0)
         return None
@@ -138,27 +219,33 @@ class ChanSelEvent(PushEvent):
         return None
 
 
-def match_event(msg: FrozenMessage) -> Optional[PushEvent]:
+def _match_control_event(msg: FrozenMessage) -> Optional[PushEvent]:
     knob_event = KnobEvent.match(msg)
     if knob_event is not None:
         return knob_event
     button_event = ButtonEvent.match(msg)
     if button_event is not None:
         return button_event
-    pad_event = PadEvent.match(msg)
-    if pad_event is not None:
-        return pad_event
     td_event = TimeDivEvent.match(msg)
     if td_event is not None:
         return td_event
     gs_event = GridSelEvent.match(msg)
     if gs_event is not None:
         return gs_event
-    cs_event = ChanSelEvent.match(msg)
-    if cs_event is not None:
-        return cs_event
-    # TODO polytouch and pitchwheel events
-    return None
+    return ChanSelEvent.match(msg)
+
+
+# Event matchers by message type: pads send notes and everything else sends
+# control changes. TODO polytouch and pitchwheel events
+_EVENT_MATCHERS: Dict[str, Callable[[FrozenMessage], Optional[PushEvent]]] = {
+    'control_change': _match_control_event,
+    **{msg_type: PadEvent.match for msg_type in NOTE_MSG_TYPES}
+}
+
+
+def match_event(msg: FrozenMessage) -> Optional[PushEvent]:
+    matcher = _EVENT_MATCHERS.get(msg.type)
+    return matcher(msg) if matcher is not None else None
 
 
 @dataclass(frozen=True)
@@ -175,7 +262,8 @@ class PushPorts(Closeable):
         delay: Optional[float]
     ) -> 'PushPorts':
         midi_in = MidiInput.open(push_port_name)
-        midi_out = MidiOutput.open(push_port_name, delay=delay)
+        # Pacing for the push happens off the main thread
+        midi_out = QueuedMidiOutput.open(push_port_name, delay=delay)
         midi_processed = MidiOutput.open(processed_port_name, virtual=True)
         return cls(midi_in=midi_in, midi_out=midi_out, midi_processed=midi_processed)
 
@@ -215,8 +303,16 @@ class PushInterface(Resettable, metaclass=ABCMeta):
     def pad_set_color(self, pos: Pos, color: Color) -> None:
         raise NotImplementedError()
 
+    def pad_set_many(self, pads: Iterable[Tuple[Pos, Optional[Color]]]) -> None:
+        """ Set a batch of pad colors (None turns the pad off) """
+        for pos, color in pads:
+            if color is None:
+                self.pad_led_off(pos)
+            else:
+                self.pad_set_color(pos, color)
+
     def pad_reset(self) -> None:
-        for pos in Pos.iter_all():
+        for pos in ALL_POS:
             self.pad_led_off(pos)
 
     @abstractmethod
@@ -227,6 +323,11 @@ class PushInterface(Resettable, metaclass=ABCMeta):
         text = text.ljust(constants.DISPLAY_MAX_LINE_LEN, ' ')
         self.lcd_display_raw(row, 0, text)
 
+    def lcd_display_lines(self, lines: Iterable[Tuple[int, str]]) -> None:
+        """ Write a batch of full lcd rows """
+        for row, text in lines:
+            self.lcd_display_line(row, text)
+
     def lcd_display_block(self, row: int, block_col: int, text: str) -> None:
         assert row >= 0 and row < constants.DISPLAY_MAX_ROWS
         assert block_col >= 0 and block_col < constants.DISPLAY_MAX_BLOCKS
@@ -254,7 +355,7 @@ class PushInterface(Resettable, metaclass=ABCMeta):
 
     def lcd_reset(self) -> None:
         for row in range(constants.DISPLAY_MAX_ROWS):
-            self.lcd_display_line(row, '')
+            self.lcd_display_raw(row, 0, _BLANK_LCD_LINE)
 
     @abstractmethod
     def button_set_illum(self, button: ButtonCC, illum: ButtonIllum) -> None:
@@ -330,6 +431,13 @@ class PushOutput(PushInterface):
         msg = make_color_msg(pos, color)
         self._midi_out.send_msg(msg)
 
+    def pad_set_many(self, pads: Iterable[Tuple[Pos, Optional[Color]]]) -> None:
+        msgs = [make_led_msg(pos, 0) if color is None else make_color_msg(pos, color) for pos, color in pads]
+        self._midi_out.send_msgs(msgs)
+
+    def pad_reset(self) -> None:
+        self._midi_out.send_msgs(_PAD_RESET_MSGS)
+
     def lcd_display_raw(self, row: int, line_col: int, text: str) -> None:
         assert row >= 0 and row < constants.DISPLAY_MAX_ROWS
         assert line_col >= 0
@@ -337,13 +445,26 @@ class PushOutput(PushInterface):
         msg = make_lcd_msg(row, line_col, text)
         self._midi_out.send_msg(msg)
 
+    def lcd_display_lines(self, lines: Iterable[Tuple[int, str]]) -> None:
+        msgs: List[FrozenMessage] = []
+        for row, text in lines:
+            assert row >= 0 and row < constants.DISPLAY_MAX_ROWS
+            assert len(text) <= constants.DISPLAY_MAX_LINE_LEN
+            msgs.append(make_lcd_msg(row, 0, text.ljust(constants.DISPLAY_MAX_LINE_LEN, ' ')))
+        self._midi_out.send_msgs(msgs)
+
+    def lcd_reset(self) -> None:
+        self._midi_out.send_msgs(_LCD_RESET_MSGS)
+
     def button_set_illum(self, button: ButtonCC, illum: ButtonIllum) -> None:
         msg = FrozenMessage(type='control_change', control=button.value, value=illum.value)
         self._midi_out.send_msg(msg)
 
     def button_off(self, button: ButtonCC) -> None:
-        msg = FrozenMessage(type='control_change', control=button.value, value=0)
-        self._midi_out.send_msg(msg)
+        self._midi_out.send_msg(_BUTTON_OFF_MSGS[button])
+
+    def button_reset(self) -> None:
+        self._midi_out.send_msgs(_BUTTON_OFF_MSGS.values())
 
     def time_div_off(self, time_div: TimeDivCC) -> None:
         raise NotImplementedError()
@@ -365,6 +486,6 @@ def rainbow(push: PushOutput) -> None:
     names = ['Red', 'Orange', 'Yellow', 'Green', 'Blue', 'Indigo', 'Violet']
     for name in names:
         color = COLORS[name]
-        for pos in Pos.iter_all():
+        for pos in ALL_POS:
             push.pad_set_color(pos, color)
         time.sleep(1)
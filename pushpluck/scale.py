@@ -56,6 +56,9 @@ class ScaleClassifier:
     def __init__(self, root: NoteName, members: Set[NoteName]) -> None:
         self._root = root
         self._members = members
+        # Note names as 12-bit masks, one bit per offset from C
+        self.root_mask = 1 << root.value
+        self.member_mask = sum(1 << name.value for name in members)
 
     def is_root(self, name: NoteName) -> bool:
         return self._root == name
@@ -67,7 +70,7 @@ class ScaleClassifier:
 @dataclass(frozen=True)
 class Scale:
     name: str
-    intervals: List[int]
+    intervals: Tuple[int, ...]
 
     def to_classifier(self, root: NoteName) -> ScaleClassifier:
         members: Set[NoteName] = set()
@@ -84,32 +87,32 @@ class Scale:
 
 
 SCALES: List[Scale] = [
-    Scale('Major', [0, 2, 4, 5, 7, 9, 11]),
-    Scale('Minor', [0, 2, 3, 5, 7, 8, 10]),
-    Scale('Dorian', [0, 2, 3, 5, 7, 9, 10]),
-    Scale('Mixolydian', [0, 2, 4, 5, 7, 9, 10]),
-    Scale('Lydian', [0, 2, 4, 6, 7, 9, 11]),
-    Scale('Phrygian', [0, 1, 3, 5, 7, 8, 10]),
-    Scale('Locrian', [0, 1, 3, 4, 7, 8, 10]),
-    Scale('Diminished', [0, 1, 3, 4, 6, 7, 9, 10]),
-    Scale('Whole-half', [0, 2, 3, 5, 6, 8, 9, 11]),
-    Scale('Whole Tone', [0, 2, 4, 6, 8, 10]),
-    Scale('Minor Blues', [0, 3, 5, 6, 7, 10]),
-    Scale('Minor Pentatonic', [0, 3, 5, 7, 10]),
-    Scale('Major Pentatonic', [0, 2, 4, 7, 9]),
-    Scale('Harmonic Minor', [0, 2, 3, 5, 7, 8, 11]),
-    Scale('Melodic Minor', [0, 2, 3, 5, 7, 9, 11]),
-    Scale('Super Locrian', [0, 1, 3, 4, 6, 8, 10]),
-    Scale('Bhairav', [0, 1, 4, 5, 7, 8, 11]),
-    Scale('Hungarian Minor', [0, 2, 3, 6, 7, 8, 11]),
-    Scale('Minor Gypsy', [0, 1, 4, 5, 7, 8, 10]),
-    Scale('Hirojoshi', [0, 2, 3, 7, 8]),
-    Scale('In-Sen', [0, 1, 5, 7, 10]),
-    Scale('Iwato', [0, 1, 5, 6, 10]),
-    Scale('Kumoi', [0, 2, 3, 7, 9]),
-    Scale('Pelog', [0, 1, 3, 4, 7, 8]),
-    Scale('Spanish', [0, 1, 3, 4, 5, 6, 8, 10]),
-    Scale('Chromatic', [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11])
+    Scale('Major', (0, 2, 4, 5, 7, 9, 11)),
+    Scale('Minor', (0, 2, 3, 5, 7, 8, 10)),
+    Scale('Dorian', (0, 2, 3, 5, 7, 9, 10)),
+    Scale('Mixolydian', (0, 2, 4, 5, 7, 9, 10)),
+    Scale('Lydian', (0, 2, 4, 6, 7, 9, 11)),
+    Scale('Phrygian', (0, 1, 3, 5, 7, 8, 10)),
+    Scale('Locrian', (0, 1, 3, 4, 7, 8, 10)),
+    Scale('Diminished', (0, 1, 3, 4, 6, 7, 9, 10)),
+    Scale('Whole-half', (0, 2, 3, 5, 6, 8, 9, 11)),
+    Scale('Whole Tone', (0, 2, 4, 6, 8, 10)),
+    Scale('Minor Blues', (0, 3, 5, 6, 7, 10)),
+    Scale('Minor Pentatonic', (0, 3, 5, 7, 10)),
+    Scale('Major Pentatonic', (0, 2, 4, 7, 9)),
+    Scale('Harmonic Minor', (0, 2, 3, 5, 7, 8, 11)),
+    Scale('Melodic Minor', (0, 2, 3, 5, 7, 9, 11)),
+    Scale('Super Locrian', (0, 1, 3, 4, 6, 8, 10)),
+    Scale('Bhairav', (0, 1, 4, 5, 7, 8, 11)),
+    Scale('Hungarian Minor', (0, 2, 3, 6, 7, 8, 11)),
+    Scale('Minor Gypsy', (0, 1, 4, 5, 7, 8, 10)),
+    Scale('Hirojoshi', (0, 2, 3, 7, 8)),
+    Scale('In-Sen', (0, 1, 5, 7, 10)),
+    Scale('Iwato', (0, 1, 5, 6, 10)),
+    Scale('Kumoi', (0, 2, 3, 7, 9)),
+    Scale('Pelog', (0, 1, 3, 4, 7, 8)),
+    Scale('Spanish', (0, 1, 3, 4, 5, 6, 8, 10)),
+    Scale('Chromatic', (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11))
 ]
 
 SCALE_LOOKUP: Dict[str, Scale] = {s.name: s for s in SCALES}
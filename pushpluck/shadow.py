@@ -4,8 +4,8 @@ from pushpluck import constants
 from pushpluck.base import Resettable
 from pushpluck.color import Color
 from pushpluck.push import PushInterface, ButtonCC, ButtonIllum, ButtonColor, TimeDivCC
-from pushpluck.pos import Pos, GridSelPos, ChanSelPos
-from typing import Dict, Generator, Optional
+from pushpluck.pos import ALL_POS, Pos, GridSelPos, ChanSelPos
+from typing import Dict, Generator, List, Optional, Tuple
 
 
 class LcdRow:
@@ -43,14 +43,6 @@ class PushState:
     pads: Dict[Pos, Optional[Color]]
     buttons: Dict[ButtonCC, Optional[ButtonIllum]]
 
-    @classmethod
-    def reset(cls) -> 'PushState':
-        return cls(
-            lcd={row: LcdRow() for row in range(constants.DISPLAY_MAX_ROWS)},
-            pads={pos: None for pos in Pos.iter_all()},
-            buttons={button: None for button in ButtonCC}
-        )
-
     @classmethod
     def diff(cls) -> 'PushState':
         return cls(
@@ -63,11 +55,17 @@ class PushState:
 class PushShadow(Resettable):
     def __init__(self, push: PushInterface) -> None:
         self._push = push
-        self._state = PushState.reset()
+        self._reset_state()
+
+    def _reset_state(self) -> None:
+        self._lcd = {row: LcdRow() for row in range(constants.DISPLAY_MAX_ROWS)}
+        self._buttons: Dict[ButtonCC, Optional[ButtonIllum]] = {button: None for button in ButtonCC}
+        # Last sent color of every pad, indexed by pos index
+        self._pad_frame: List[Optional[Color]] = [None] * len(ALL_POS)
 
     def reset(self) -> None:
         self._push.reset()
-        self._state = PushState.reset()
+        self._reset_state()
 
     @contextmanager
     def context(self) -> Generator['PushInterface', None, None]:
@@ -82,33 +80,35 @@ class PushShadow(Resettable):
         self._emit_buttons(diff_state)
 
     def _emit_lcd(self, diff_state: PushState) -> None:
+        changed: List[Tuple[int, str]] = []
         for row, new_row in diff_state.lcd.items():
-            old_row = self._state.lcd[row]
+            old_row = self._lcd[row]
             new_text = new_row.get_all_text()
             if old_row.set_all_text(new_text):
-                self._push.lcd_display_raw(row, 0, new_text)
+                changed.append((row, new_text))
+        if len(changed) > 0:
+            self._push.lcd_display_lines(changed)
 
     def _emit_pads(self, diff_state: PushState) -> None:
+        frame = self._pad_frame
+        changed: List[Tuple[Pos, Optional[Color]]] = []
         for pos, new_color in diff_state.pads.items():
-            old_color = self._state.pads.get(pos)
-            if old_color != new_color:
-                if new_color is None:
-                    self._push.pad_led_off(pos)
-                    if pos in self._state.pads:
-                        del self._state.pads[pos]
-                else:
-                    self._push.pad_set_color(pos, new_color)
-                    self._state.pads[pos] = new_color
+            index = pos.to_index()
+            if frame[index] != new_color:
+                changed.append((pos, new_color))
+                frame[index] = new_color
+        if len(changed) > 0:
+            self._push.pad_set_many(changed)
 
     def _emit_buttons(self, diff_state: PushState) -> None:
         for button, new_illum in diff_state.buttons.items():
-            old_illum = self._state.buttons[button]
+            old_illum = self._buttons.get(button)
             if old_illum != new_illum:
                 if new_illum is None:
                     self._push.button_off(button)
-                    del self._state.buttons[button]
                 else:
                     self._push.button_set_illum(button, new_illum)
+                self._buttons[button] = new_illum
 
 
 class PushShadowManaged(PushInterface):
@@ -1,11 +1,12 @@
 from dataclasses import dataclass
+from functools import lru_cache
 from pushpluck import constants
 from pushpluck.base import Unit
 from pushpluck.component import MappedComponent, MappedComponentConfig
 from pushpluck.config import Config, Layout
 from pushpluck.fretboard import StringPos, StringBounds
-from pushpluck.pos import Pos
-from typing import List, Optional
+from pushpluck.pos import ALL_POS, Pos
+from typing import Dict, List, Optional, Tuple
 
 
 @dataclass(frozen=True)
@@ -16,6 +17,7 @@ class ViewportConfig(MappedComponentConfig[Config]):
     fret_offset: int
 
     @classmethod
+    @lru_cache(maxsize=4)
     def extract(cls, root_config: Config) -> 'ViewportConfig':
         return cls(
             num_strings=len(root_config.tuning),
@@ -34,10 +36,26 @@ class Viewport(MappedComponent[Config, ViewportConfig, Unit]):
     def extract_config(cls, root_config: Config) -> ViewportConfig:
         return ViewportConfig.extract(root_config)
 
+    def __init__(self, config: ViewportConfig) -> None:
+        super().__init__(config)
+        self._build_tables()
+
     def handle_mapped_config(self, config: ViewportConfig) -> Unit:
         self._config = config
+        self._build_tables()
         return Unit.instance()
 
+    def _build_tables(self) -> None:
+        # The string offset only depends on the config, so compute it once
+        self._total_offset = self._view_str_offset() + self._config.str_offset
+        # Both directions are precomputed for every pad on the grid;
+        # anything off the grid falls back to computing the mapping.
+        str_pos_by_pad = tuple(self._compute_str_pos(pos) for pos in ALL_POS)
+        self._str_pos_by_pad: Tuple[Optional[StringPos], ...] = str_pos_by_pad
+        self._pad_by_str_pos: Dict[StringPos, Pos] = {
+            str_pos: pos for pos, str_pos in zip(ALL_POS, str_pos_by_pad) if str_pos is not None
+        }
+
     def _view_str_offset(self) -> int:
         max_str_dim = constants.NUM_PAD_ROWS if self._config.layout == Layout.Horiz else constants.NUM_PAD_COLS
         offset = 0
@@ -47,9 +65,15 @@ class Viewport(MappedComponent[Config, ViewportConfig, Unit]):
         return offset
 
     def _total_str_offset(self) -> int:
-        return self._view_str_offset() + self._config.str_offset
+        return self._total_offset
 
     def str_pos_from_pad_pos(self, pos: Pos) -> Optional[StringPos]:
+        if 0 <= pos.row < constants.NUM_PAD_ROWS and 0 <= pos.col < constants.NUM_PAD_COLS:
+            return self._str_pos_by_pad[pos.to_index()]
+        else:
+            return self._compute_str_pos(pos)
+
+    def _compute_str_pos(self, pos: Pos) -> Optional[StringPos]:
         str_index: int
         fret: int
         if self._config.layout == Layout.Horiz:
@@ -65,11 +89,11 @@ class Viewport(MappedComponent[Config, ViewportConfig, Unit]):
         else:
             return StringPos(str_index=str_index, fret=fret)
 
-    def str_pos_from_input_note(self, note: int) -> Optional[StringPos]:
-        pos = Pos.from_input_note(note)
-        return self.str_pos_from_pad_pos(pos) if pos is not None else None
-
     def pad_pos_from_str_pos(self, str_pos: StringPos) -> Optional[Pos]:
+        pos = self._pad_by_str_pos.get(str_pos)
+        return pos if pos is not None else self._compute_pad_pos(str_pos)
+
+    def _compute_pad_pos(self, str_pos: StringPos) -> Optional[Pos]:
         str_dim = str_pos.str_index - self._total_str_offset()
         fret_dim = str_pos.fret - self._config.fret_offset
         row: int
@@ -85,7 +109,7 @@ class Viewport(MappedComponent[Config, ViewportConfig, Unit]):
         elif col < 0 or col >= constants.NUM_PAD_COLS:
             return None
         else:
-            return Pos(row=row, col=col)
+            return ALL_POS[row * constants.NUM_PAD_COLS + col]
 
     def str_bounds(self) -> Optional[StringBounds]:
         view_offset = self._view_str_offset()
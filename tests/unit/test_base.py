@@ -0,0 +1,35 @@
+from copy import copy, deepcopy
+from mido.frozen import FrozenMessage
+from pushpluck.base import FrozenSlots
+from pushpluck.color import Color
+from pushpluck.config import VisState
+from pushpluck.fretboard import FretboardMessage, NoteEffects, NoteGroup, StringBounds, StringPos
+from pushpluck.pos import Pos
+from pushpluck.push import PadEvent
+
+import pickle
+import pytest
+
+
+_LOW = StringPos(str_index=0, fret=1)
+_HIGH = StringPos(str_index=5, fret=9)
+_MSG = FrozenMessage(type='note_on', channel=1, note=41, velocity=100)
+
+
+@pytest.mark.parametrize(
+    'value',
+    [
+        Pos(2, 5),
+        Color(1, 2, 3),
+        _LOW,
+        NoteGroup(41, _LOW, [_HIGH]),
+        FretboardMessage(_LOW, [_HIGH], _MSG),
+        StringBounds(_LOW, _HIGH),
+        NoteEffects({_LOW: VisState.OnPrimary}, [_MSG]),
+        PadEvent(Pos(3, 4), 90),
+    ]
+)
+def test_frozen_slots_copy_and_pickle(value: FrozenSlots) -> None:
+    for other in [copy(value), deepcopy(value), pickle.loads(pickle.dumps(value))]:
+        assert type(other) is type(value)
+        assert other == value
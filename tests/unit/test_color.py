@@ -0,0 +1,26 @@
+from pushpluck.color import COLORS, Color
+
+import pytest
+
+
+@pytest.mark.parametrize(
+    'code, color',
+    [
+        ('#000000', Color(0, 0, 0)),
+        ('#FFA580', Color(0xFF, 0xA5, 0x80)),
+        ('#0A0B0C', Color(10, 11, 12)),
+    ]
+)
+def test_color_code(code: str, color: Color) -> None:
+    assert Color.from_code(code) == color
+    assert color.to_code() == code
+
+
+def test_named_colors() -> None:
+    for color in COLORS.values():
+        assert Color.from_code(color.to_code()) == color
+
+
+def test_color_iter() -> None:
+    red, green, blue = Color(1, 2, 3)
+    assert (red, green, blue) == (1, 2, 3)
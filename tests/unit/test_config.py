@@ -0,0 +1,45 @@
+from dataclasses import replace
+from pushpluck.color import Color
+from pushpluck.config import NoteType, PadColorMapper, VisState, default_scheme, init_config
+from typing import Optional
+
+import pytest
+
+
+SCHEME = default_scheme()
+
+
+@pytest.mark.parametrize(
+    'mapper, vis, color',
+    [
+        (PadColorMapper.note(NoteType.Root), VisState.Off, SCHEME.root_note),
+        (PadColorMapper.note(NoteType.Member), VisState.Off, SCHEME.member_note),
+        (PadColorMapper.note(NoteType.Other), VisState.Off, SCHEME.other_note),
+        (PadColorMapper.note(NoteType.Root), VisState.OnPrimary, SCHEME.primary_note),
+        (PadColorMapper.note(NoteType.Other), VisState.OnDisabled, SCHEME.disabled_note),
+        (PadColorMapper.note(NoteType.Member), VisState.OnLinked, SCHEME.linked_note),
+        (PadColorMapper.misc(False), VisState.OnPrimary, None),
+        (PadColorMapper.misc(True), VisState.Off, None),
+        (PadColorMapper.misc(True), VisState.OnPrimary, SCHEME.misc_pressed),
+        (PadColorMapper.control(), VisState.Off, SCHEME.control),
+        (PadColorMapper.control(), VisState.OnLinked, SCHEME.control_pressed),
+    ]
+)
+def test_pad_color(mapper: PadColorMapper, vis: VisState, color: Optional[Color]) -> None:
+    assert mapper.get_color(SCHEME, vis) == color
+    assert mapper.resolve(SCHEME)[vis.index] == color
+
+
+def test_vis_flags() -> None:
+    assert [vis for vis in VisState if vis.primary] == [VisState.OnPrimary]
+    assert [vis for vis in VisState if not vis.active] == [VisState.Off]
+    assert [vis for vis in VisState if not vis.enabled] == [VisState.OnDisabled]
+    assert [vis.index for vis in VisState] == list(range(len(VisState)))
+
+
+def test_config_hashable() -> None:
+    config = init_config(min_velocity=0)
+    same = replace(config, tuning=tuple(config.tuning))
+    assert same == config
+    assert hash(same) == hash(config)
+    assert replace(config, str_offset=1) != config
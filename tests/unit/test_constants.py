@@ -0,0 +1,25 @@
+from pushpluck import constants
+from pushpluck.constants import KnobCC, KnobGroup, knob_group_and_offset
+from typing import Tuple
+
+import pytest
+
+
+@pytest.mark.parametrize(
+    'knob, expected',
+    [
+        (KnobCC.L0, (KnobGroup.Left, 0)),
+        (KnobCC.L1, (KnobGroup.Left, 1)),
+        (KnobCC.C0, (KnobGroup.Center, 0)),
+        (KnobCC.C7, (KnobGroup.Center, 7)),
+        (KnobCC.R0, (KnobGroup.Right, 0)),
+    ]
+)
+def test_knob_group_and_offset(knob: KnobCC, expected: Tuple[KnobGroup, int]) -> None:
+    assert knob_group_and_offset(knob) == expected
+
+
+def test_enum_value_tables() -> None:
+    for control in range(constants.MIDI_NUM_CONTROLS):
+        assert constants.BUTTON_CC_VALUE_TABLE[control] == constants.BUTTON_CC_VALUE_LOOKUP.get(control)
+        assert constants.TIME_DIV_CC_VALUE_TABLE[control] == constants.TIME_DIV_CC_VALUE_LOOKUP.get(control)
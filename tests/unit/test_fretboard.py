@@ -0,0 +1,231 @@
+from copy import copy
+from dataclasses import replace
+from mido.frozen import FrozenMessage
+from pushpluck.config import Config, PlayMode, VisState, init_config
+from pushpluck.fretboard import BoundedConfig, ChokeGroup, ChokeNoteHandler, FixedTuner, Fretboard, FretboardConfig, FretboardMessage, MultiChannelMapper, NoteEffects, StringBounds, StringPos
+from pushpluck.midi import make_note_off_msg
+from pushpluck.viewport import Viewport
+
+
+def make_fretboard(config: Config) -> Fretboard:
+    bounds = Viewport.construct(config).str_bounds()
+    return Fretboard.construct(BoundedConfig(bounds, config))
+
+
+def test_string_pos_eq_and_hash() -> None:
+    a = StringPos(str_index=1, fret=-2)
+    b = StringPos(str_index=1, fret=-2)
+    assert a == b
+    assert hash(a) == hash(b)
+    assert a != StringPos(str_index=2, fret=-2)
+    assert a != StringPos(str_index=1, fret=2)
+    assert {a: 'x'}[b] == 'x'
+    assert copy(a) == a
+    assert hash(copy(a)) == hash(a)
+
+
+def test_tap_hammer_on_and_pull_off() -> None:
+    fretboard = make_fretboard(init_config(min_velocity=20))
+    low = StringPos(str_index=0, fret=1)
+    high = StringPos(str_index=0, fret=3)
+    fx = fretboard.trigger(low, 100)
+    assert [(m.note, m.velocity) for m in fx.msgs] == [(41, 100)]
+    assert fx.vis[low] == VisState.OnPrimary
+    # Hammer-on sends on for the higher note before off for the lower
+    fx = fretboard.trigger(high, 50)
+    assert [(m.note, m.velocity) for m in fx.msgs] == [(43, 50), (41, 0)]
+    # Pull-off
+    fx = fretboard.trigger(high, 0)
+    assert [(m.note, m.velocity) for m in fx.msgs] == [(41, 100), (43, 0)]
+    fx = fretboard.trigger(low, 0)
+    assert [(m.note, m.velocity) for m in fx.msgs] == [(41, 0)]
+    assert fx.vis[low] == VisState.Off
+
+
+def test_min_velocity() -> None:
+    config = replace(init_config(min_velocity=20), play_mode=PlayMode.Poly)
+    fretboard = make_fretboard(config)
+    fx = fretboard.trigger(StringPos(str_index=1, fret=0), 5)
+    assert [(m.note, m.velocity) for m in fx.msgs] == [(45, 20)]
+
+
+def test_repeated_notes_reuse_messages() -> None:
+    config = replace(init_config(min_velocity=20), play_mode=PlayMode.Poly)
+    bounds = Viewport.construct(config).str_bounds()
+    fretboard = Fretboard.construct(BoundedConfig(bounds, config))
+    str_pos = StringPos(str_index=1, fret=2)
+    first = fretboard.trigger(str_pos, 100).msgs[0]
+    fretboard.trigger(str_pos, 0)
+    assert fretboard.trigger(str_pos, 100).msgs[0] is first
+    fretboard.trigger(str_pos, 0)
+    # Config changes invalidate the cached messages
+    fretboard.handle_config(BoundedConfig(bounds, replace(config, min_velocity=30)), reset=False)
+    assert fretboard.trigger(str_pos, 100).msgs[0] is not first
+
+
+def test_equivs_disabled() -> None:
+    config = replace(init_config(min_velocity=20), play_mode=PlayMode.Poly)
+    fretboard = make_fretboard(config)
+    # Fret 5 on the low string is the same note as the open second string
+    fx = fretboard.trigger(StringPos(str_index=0, fret=5), 100)
+    assert fx.vis[StringPos(str_index=1, fret=0)] == VisState.OnDisabled
+    assert fretboard.trigger(StringPos(str_index=1, fret=0), 100) is NoteEffects.empty()
+
+
+def test_config_change_releases_notes() -> None:
+    config = init_config(min_velocity=20)
+    bounds = Viewport.construct(config).str_bounds()
+    fretboard = Fretboard.construct(BoundedConfig(bounds, config))
+    fretboard.trigger(StringPos(str_index=2, fret=2), 100)
+    new_config = replace(config, play_mode=PlayMode.Poly)
+    fx = fretboard.handle_config(BoundedConfig(bounds, new_config), reset=False)
+    assert fx is not None
+    assert [(m.note, m.velocity) for m in fx.msgs] == [(52, 0)]
+
+
+def test_tuner_reused_when_toggling_bounds() -> None:
+    config = init_config(min_velocity=20)
+    bounds = Viewport.construct(config).str_bounds()
+    assert bounds is not None
+    shifted = StringBounds(replace(bounds.low, fret=1), replace(bounds.high, fret=bounds.high.fret + 1))
+    fretboard = Fretboard.construct(BoundedConfig(bounds, config))
+    tuner = fretboard._tuner
+    fretboard.handle_config(BoundedConfig(shifted, config), reset=False)
+    assert fretboard._tuner is not tuner
+    fretboard.handle_config(BoundedConfig(bounds, config), reset=False)
+    assert fretboard._tuner is tuner
+
+
+def test_extract_reuses_config() -> None:
+    config = init_config(min_velocity=20)
+    bounds = Viewport.construct(config).str_bounds()
+    fret_config = FretboardConfig.extract(BoundedConfig(bounds, config))
+    # Equal root configs extract to the same instance
+    assert FretboardConfig.extract(BoundedConfig(bounds, replace(config))) is fret_config
+    other = FretboardConfig.extract(BoundedConfig(bounds, replace(config, min_velocity=30)))
+    assert other.min_velocity == 30
+
+
+def test_fixed_tuner() -> None:
+    tuning = (40, 45, 50)
+    # Bounds extend past the last string and below the nut
+    bounds = StringBounds(StringPos(str_index=1, fret=-1), StringPos(str_index=3, fret=5))
+    tuner = FixedTuner(tuning, bounds)
+    for str_pos in bounds:
+        expected = tuning[str_pos.str_index] + str_pos.fret if str_pos.str_index < len(tuning) else None
+        assert tuner.get_note(str_pos) == expected
+    assert tuner.get_note(StringPos(str_index=0, fret=0)) is None
+    assert tuner.get_note(StringPos(str_index=1, fret=6)) is None
+    assert tuner.get_note_group(StringPos(str_index=3, fret=0)) is None
+    group = tuner.get_note_group(StringPos(str_index=1, fret=5))
+    assert group is not None
+    assert group.note == 50
+    assert group.primary == StringPos(str_index=1, fret=5)
+    assert group.equivs == [StringPos(str_index=1, fret=5), StringPos(str_index=2, fret=0)]
+    assert FixedTuner(tuning, None).get_note(StringPos(str_index=0, fret=0)) is None
+
+
+def test_config_change_releases_sounding_notes_in_order() -> None:
+    config = replace(init_config(min_velocity=20), play_mode=PlayMode.Poly)
+    bounds = Viewport.construct(config).str_bounds()
+    fretboard = Fretboard.construct(BoundedConfig(bounds, config))
+    fretboard.trigger(StringPos(str_index=3, fret=1), 100)
+    fretboard.trigger(StringPos(str_index=0, fret=2), 100)
+    fretboard.trigger(StringPos(str_index=1, fret=0), 100)
+    fretboard.trigger(StringPos(str_index=1, fret=0), 0)
+    fx = fretboard.handle_config(BoundedConfig(bounds, replace(config, play_mode=PlayMode.Tap)), reset=False)
+    assert fx is not None
+    assert [(m.note, m.velocity) for m in fx.msgs] == [(42, 0), (56, 0)]
+
+
+def test_choke_group_max() -> None:
+    def fret_msg(fret: int, velocity: int) -> FretboardMessage:
+        msg = FrozenMessage(type='note_on', channel=1, note=40 + fret, velocity=velocity)
+        return FretboardMessage(StringPos(str_index=0, fret=fret), [], msg)
+
+    group = ChokeGroup.empty()
+    assert group.max_msg() is None
+    for fret in [3, 1, 5]:
+        group.trigger(fret_msg(fret, 100))
+    assert group.max_msg() == fret_msg(5, 100)
+    group.trigger(fret_msg(1, 0))
+    assert group.max_msg() == fret_msg(5, 100)
+    assert group.trigger(fret_msg(5, 0)) == (fret_msg(5, 100), fret_msg(3, 100))
+    assert group.max_msg() == fret_msg(3, 100)
+    # Releasing an unfingered note is ignored
+    group.trigger(fret_msg(7, 0))
+    group.trigger(fret_msg(3, 0))
+    assert group.max_msg() is None
+
+
+def test_multi_channel_mapper() -> None:
+    mapper = MultiChannelMapper(base_channel=1, min_channel=2, max_channel=4)
+    channels = [mapper.map_channel(StringPos(str_index=i, fret=0)) for i in range(-1, 5)]
+    assert channels == [None, None, 2, 3, 4, None]
+
+
+def test_tracker_forgets_released_notes() -> None:
+    config = replace(init_config(min_velocity=20), play_mode=PlayMode.Poly)
+    fretboard = make_fretboard(config)
+    str_pos = StringPos(str_index=0, fret=5)
+    fx = fretboard.trigger(str_pos, 100)
+    assert fx.vis == {str_pos: VisState.OnPrimary, StringPos(str_index=1, fret=0): VisState.OnDisabled}
+    fx = fretboard.trigger(str_pos, 0)
+    assert fx.vis == {str_pos: VisState.Off, StringPos(str_index=1, fret=0): VisState.Off}
+    # Nothing is lit, so a config change has nothing to clean up
+    assert fretboard.handle_config(BoundedConfig(None, config), reset=True) is NoteEffects.empty()
+
+
+def test_note_off_msg_shared() -> None:
+    fret_msg = FretboardMessage(
+        str_pos=StringPos(str_index=0, fret=1),
+        equivs=[],
+        msg=FrozenMessage('note_on', channel=1, note=41, velocity=90)
+    )
+    note_off = fret_msg.make_note_off_msg()
+    assert note_off.msg == FrozenMessage('note_on', channel=1, note=41, velocity=0)
+    assert fret_msg.make_note_off_msg() is note_off
+    assert note_off == fret_msg.make_note_msg(0)
+    assert note_off.msg is make_note_off_msg(1, 41)
+
+
+def test_config_change_clears_fingered_notes() -> None:
+    config = init_config(min_velocity=20)
+    bounds = Viewport.construct(config).str_bounds()
+    fretboard = Fretboard.construct(BoundedConfig(bounds, config))
+    low = StringPos(str_index=0, fret=1)
+    high = StringPos(str_index=0, fret=3)
+    fretboard.trigger(low, 100)
+    fx = fretboard.handle_config(BoundedConfig(bounds, replace(config, min_velocity=30)), reset=False)
+    assert fx is not None
+    assert [(m.note, m.velocity) for m in fx.msgs] == [(41, 0)]
+    # The released note no longer chokes the string
+    fx = fretboard.trigger(high, 100)
+    assert [(m.note, m.velocity) for m in fx.msgs] == [(43, 100)]
+    assert fretboard.get_vis(low) == VisState.Off
+
+
+def test_mono_releases_previous_note() -> None:
+    config = replace(init_config(min_velocity=20), play_mode=PlayMode.Mono)
+    fretboard = make_fretboard(config)
+    first = StringPos(str_index=0, fret=1)
+    second = StringPos(str_index=2, fret=1)
+    fx = fretboard.trigger(first, 100)
+    assert [(m.note, m.velocity) for m in fx.msgs] == [(41, 100)]
+    fx = fretboard.trigger(second, 100)
+    assert [(m.note, m.velocity) for m in fx.msgs] == [(41, 0), (51, 100)]
+    # Releasing the replaced note does nothing
+    assert fretboard.trigger(first, 0) is NoteEffects.empty()
+    fx = fretboard.trigger(second, 0)
+    assert [(m.note, m.velocity) for m in fx.msgs] == [(51, 0)]
+
+
+def test_choke_retrigger_with_equal_copy() -> None:
+    def fret_msg() -> FretboardMessage:
+        msg = FrozenMessage(type='note_on', channel=1, note=41, velocity=100)
+        return FretboardMessage(StringPos(str_index=0, fret=1), [], msg)
+
+    handler = ChokeNoteHandler(num_strings=1)
+    assert handler.trigger(fret_msg()) == (fret_msg(),)
+    # An equal but distinct message leaves the sounding note alone
+    assert handler.trigger(fret_msg()) == ()
@@ -0,0 +1,21 @@
+from pushpluck.config import init_config
+from pushpluck.constants import ButtonCC
+from pushpluck.menu import Menu, default_menu_layout
+from pushpluck.push import ButtonEvent
+from pushpluck.shadow import PushShadowManaged, PushState
+
+
+def test_menu_config_updates() -> None:
+    state = PushState.diff()
+    push = PushShadowManaged(state)
+    config = init_config(min_velocity=20)
+    menu = Menu(default_menu_layout(), config)
+    # Switching pages redraws but leaves the config alone
+    assert menu.handle_event(push, ButtonEvent(ButtonCC.Scales, True)) is None
+    assert len(state.buttons) > 0
+    # Shifting changes the config
+    new_config = menu.handle_event(push, ButtonEvent(ButtonCC.OctaveUp, True))
+    assert new_config is not None
+    assert new_config.fret_offset == config.fret_offset + 12
+    # Releases are ignored
+    assert menu.handle_event(push, ButtonEvent(ButtonCC.OctaveUp, False)) is None
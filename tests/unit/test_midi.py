@@ -0,0 +1,121 @@
+from mido import Message
+from mido.frozen import FrozenMessage
+from mido.ports import BaseInput, BaseOutput
+from pushpluck.midi import MidiInput, MidiOutput, QueuedMidiOutput, make_note_off_msg, make_note_on_msg
+from queue import SimpleQueue
+from typing import List, Optional
+
+import pytest
+import time
+
+
+def test_recv_msgs() -> None:
+    queue: 'SimpleQueue[Message]' = SimpleQueue()
+    midi_in = MidiInput(in_port_name='test', in_port=BaseInput(), queue=queue)
+    for note in range(5):
+        queue.put_nowait(Message('note_on', note=note, velocity=100))
+    assert [msg.note for msg in midi_in.recv_msgs(3)] == [0, 1, 2]
+    assert [msg.note for msg in midi_in.recv_msgs(3)] == [3, 4]
+    assert queue.empty()
+
+
+def test_note_off_msg() -> None:
+    msg = make_note_off_msg(2, 60)
+    assert (msg.type, msg.channel, msg.note, msg.velocity) == ('note_on', 2, 60, 0)
+    assert make_note_off_msg(2, 60) is msg
+    assert make_note_off_msg(3, 60) is not msg
+
+
+def test_note_on_msg() -> None:
+    msg = make_note_on_msg(2, 60, 100)
+    expected = FrozenMessage(type='note_on', channel=2, note=60, velocity=100)
+    assert msg == expected
+    assert hash(msg) == hash(expected)
+    assert msg.bytes() == expected.bytes()
+    with pytest.raises(ValueError):
+        msg.velocity = 0  # type: ignore
+
+
+@pytest.mark.parametrize('channel, note, velocity', [(-1, 60, 100), (16, 60, 100), (2, -1, 100), (2, 128, 100), (2, 60, -1), (2, 60, 128)])
+def test_note_on_msg_out_of_range(channel: int, note: int, velocity: int) -> None:
+    with pytest.raises(ValueError):
+        make_note_on_msg(channel, note, velocity)
+
+
+class TimedPort(BaseOutput):
+    def __init__(self) -> None:
+        super().__init__()
+        self.sent: List[Message] = []
+        self.times: List[float] = []
+
+    def _send(self, msg: Message) -> None:
+        self.sent.append(msg)
+        self.times.append(time.monotonic())
+
+
+class FakeClock:
+    """ Stands in for time.monotonic and time.sleep, oversleeping by a fixed amount """
+
+    def __init__(self, oversleep: float = 0.0) -> None:
+        self.now = 10.0
+        self.oversleep = oversleep
+        self.sleeps: List[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, secs: float) -> None:
+        self.sleeps.append(secs)
+        self.now += secs + self.oversleep
+
+
+def patch_clock(monkeypatch: pytest.MonkeyPatch, oversleep: float = 0.0) -> FakeClock:
+    clock = FakeClock(oversleep)
+    monkeypatch.setattr(time, 'monotonic', clock.monotonic)
+    monkeypatch.setattr(time, 'sleep', clock.sleep)
+    return clock
+
+
+@pytest.mark.parametrize('delay', [None, 0.002])
+def test_send_msgs(monkeypatch: pytest.MonkeyPatch, delay: Optional[float]) -> None:
+    clock = patch_clock(monkeypatch)
+    port = TimedPort()
+    midi_out = MidiOutput('test', port, delay=delay)
+    msgs = [make_note_on_msg(0, note, 100) for note in range(4)]
+    midi_out.send_msgs(msgs)
+    midi_out.send_msg(msgs[0])
+    assert port.sent == msgs + [msgs[0]]
+    if delay is None:
+        assert clock.sleeps == []
+    else:
+        # The first send is due immediately, the rest wait one delay each
+        assert clock.sleeps == pytest.approx([delay] * 4)
+        assert port.times == pytest.approx([10.0 + i * delay for i in range(5)])
+
+
+def test_send_msgs_absorbs_oversleep(monkeypatch: pytest.MonkeyPatch) -> None:
+    delay = 0.001
+    oversleep = 0.0004
+    clock = patch_clock(monkeypatch, oversleep)
+    port = TimedPort()
+    midi_out = MidiOutput('test', port, delay=delay)
+    msgs = [make_note_on_msg(0, note, 100) for note in range(100)]
+    midi_out.send_msgs(msgs)
+    # After the first wait, each sleep is shortened by the previous overshoot,
+    # so sends stay on the original schedule instead of drifting later
+    assert clock.sleeps == pytest.approx([delay] + [delay - oversleep] * (len(msgs) - 2))
+    assert port.times == pytest.approx([10.0] + [10.0 + i * delay + oversleep for i in range(1, len(msgs))])
+
+
+def test_queued_send_msgs() -> None:
+    port = TimedPort()
+    midi_out = QueuedMidiOutput('test', port, delay=0.001)
+    msgs = [make_note_on_msg(0, note, 100) for note in range(4)]
+    midi_out.send_msg(msgs[0])
+    midi_out.send_msgs(msgs[1:])
+    midi_out.flush()
+    assert port.sent == msgs
+    midi_out.send_msg(msgs[0])
+    midi_out.close()
+    assert port.sent == msgs + [msgs[0]]
+    assert port.closed
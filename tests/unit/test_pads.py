@@ -0,0 +1,78 @@
+from dataclasses import replace
+from mido.frozen import FrozenMessage
+from pushpluck.config import default_scheme, init_config
+from pushpluck.midi import MidiSink
+from pushpluck.pads import Pads
+from pushpluck.pos import Pos
+from pushpluck.push import PadEvent
+from pushpluck.shadow import PushShadowManaged, PushState
+from typing import List
+
+
+class RecordingSink(MidiSink):
+    def __init__(self) -> None:
+        self.msgs: List[FrozenMessage] = []
+
+    def send_msg(self, msg: FrozenMessage) -> None:
+        self.msgs.append(msg)
+
+
+def test_pads_press_and_release() -> None:
+    scheme = default_scheme()
+    pads = Pads.construct(scheme, init_config(min_velocity=0))
+    state = PushState.diff()
+    push = PushShadowManaged(state)
+    sink = RecordingSink()
+    # Six strings are centered in eight rows, so the outer rows are unused
+    pads.redraw(push)
+    assert len(state.pads) == 64
+    assert state.pads[Pos(0, 0)] is None
+    assert state.pads[Pos(1, 0)] == scheme.member_note
+    assert state.pads[Pos(1, 2)] == scheme.other_note
+    assert state.pads[Pos(2, 3)] == scheme.root_note
+    state.pads.clear()
+    # Pressing sounds the open low string and lights the pad
+    pads.handle_event(push, sink, PadEvent(Pos(1, 0), 100))
+    assert [(msg.type, msg.note, msg.velocity) for msg in sink.msgs] == [('note_on', 40, 100)]
+    assert state.pads == {Pos(1, 0): scheme.primary_note}
+    # Releasing silences it and restores the pad color
+    pads.handle_event(push, sink, PadEvent(Pos(1, 0), 0))
+    assert [(msg.type, msg.note, msg.velocity) for msg in sink.msgs[1:]] == [('note_on', 40, 0)]
+    assert state.pads == {Pos(1, 0): scheme.member_note}
+    # Pads outside the strings are ignored
+    pads.handle_event(push, sink, PadEvent(Pos(0, 0), 100))
+    assert len(sink.msgs) == 2
+
+
+def test_pads_config_change_releases_notes() -> None:
+    scheme = default_scheme()
+    config = init_config(min_velocity=0)
+    pads = Pads.construct(scheme, config)
+    state = PushState.diff()
+    push = PushShadowManaged(state)
+    sink = RecordingSink()
+    pads.handle_event(push, sink, PadEvent(Pos(1, 0), 100))
+    assert state.pads[Pos(1, 0)] == scheme.primary_note
+    state.pads.clear()
+    pads.handle_config(push, sink, replace(config, str_offset=1), reset=False)
+    assert [(msg.type, msg.note, msg.velocity) for msg in sink.msgs] == [('note_on', 40, 100), ('note_on', 40, 0)]
+    # Every pad is repainted and the released pad is no longer primary
+    assert len(state.pads) == 64
+    assert scheme.primary_note not in state.pads.values()
+
+
+def test_pads_view_change_clears_held_pad() -> None:
+    scheme = default_scheme()
+    config = init_config(min_velocity=0)
+    pads = Pads.construct(scheme, config)
+    state = PushState.diff()
+    push = PushShadowManaged(state)
+    sink = RecordingSink()
+    pads.handle_event(push, sink, PadEvent(Pos(1, 3), 100))
+    assert state.pads[Pos(1, 3)] == scheme.primary_note
+    state.pads.clear()
+    pads.handle_config(push, sink, replace(config, fret_offset=1), reset=False)
+    assert [(msg.type, msg.velocity) for msg in sink.msgs] == [('note_on', 100), ('note_on', 0)]
+    # Every pad is repainted, and none is left lit as primary
+    assert len(state.pads) == 64
+    assert scheme.primary_note not in state.pads.values()
@@ -0,0 +1,40 @@
+from dataclasses import asdict
+from pushpluck import constants
+from pushpluck.pos import ChanSelPos, GridSelPos, Pos
+from pushpluck.push import PadEvent
+
+
+def test_pos_note_round_trip() -> None:
+    for note in range(constants.LOW_NOTE, constants.HIGH_NOTE):
+        pos = Pos.from_input_note(note)
+        assert pos is not None
+        assert pos.to_note() == note
+        assert pos == Pos(pos.row, pos.col)
+        assert pos.to_index() == Pos(pos.row, pos.col).to_index()
+
+
+def test_pos_out_of_range() -> None:
+    assert Pos.from_input_note(constants.LOW_NOTE - 1) is None
+    assert Pos.from_input_note(constants.HIGH_NOTE) is None
+    assert Pos.from_input_note(0) is None
+    assert Pos.from_input_note(constants.MIDI_NUM_NOTES - 1) is None
+    assert Pos.from_input_note(constants.MIDI_NUM_NOTES) is None
+    assert Pos.from_input_note(-1) is None
+    assert Pos.from_input_note(constants.LOW_NOTE - constants.MIDI_NUM_NOTES) is None
+
+
+def test_pos_iter_all() -> None:
+    positions = list(Pos.iter_all())
+    assert len(positions) == constants.NUM_PADS
+    assert [pos.to_index() for pos in positions] == list(range(constants.NUM_PADS))
+
+
+def test_sel_pos_iter_all() -> None:
+    assert list(ChanSelPos.iter_all()) == [ChanSelPos(col) for col in range(constants.NUM_PAD_COLS)]
+    assert list(GridSelPos.iter_all()) == [GridSelPos(col) for col in range(constants.NUM_PAD_COLS)]
+
+
+def test_pad_event_asdict() -> None:
+    # asdict deep copies each field value
+    pos = Pos(2, 5)
+    assert asdict(PadEvent(pos, 100)) == {'pos': pos, 'velocity': 100}
@@ -0,0 +1,110 @@
+from mido import Message
+from mido.frozen import FrozenMessage
+from mido.ports import BaseOutput
+from pushpluck import constants
+from pushpluck.color import Color
+from pushpluck.constants import ButtonCC, KnobCC, KnobGroup
+from pushpluck.midi import MidiOutput
+from pushpluck.pos import Pos
+from pushpluck.push import ButtonEvent, KnobEvent, PadEvent, PushEvent, PushOutput, make_color_msg, make_lcd_msg, make_led_msg, match_event, warm_color_msgs
+from typing import List, Optional
+
+import pytest
+
+
+@pytest.mark.parametrize(
+    'pos, color, payload',
+    [
+        (Pos(0, 0), Color(0, 0, 0), [4, 0, 8, 0, 0, 0, 0, 0, 0, 0, 0]),
+        (Pos(0, 1), Color(255, 0, 0), [4, 0, 8, 1, 0, 15, 15, 0, 0, 0, 0]),
+        (Pos(7, 7), Color(0x12, 0x34, 0xAB), [4, 0, 8, 63, 0, 1, 2, 3, 4, 10, 11]),
+    ]
+)
+def test_color_msg(pos: Pos, color: Color, payload: List[int]) -> None:
+    msg = make_color_msg(pos, color)
+    assert msg.type == 'sysex'
+    assert list(msg.data) == list(constants.PUSH_SYSEX_PREFIX) + payload
+
+
+def test_color_msg_cached() -> None:
+    msg = make_color_msg(Pos(2, 3), Color(10, 20, 30))
+    assert make_color_msg(Pos(2, 3), Color(10, 20, 30)) is msg
+    assert make_color_msg(Pos(2, 4), Color(10, 20, 30)) is not msg
+
+
+def test_warm_color_msgs() -> None:
+    color = Color(11, 22, 33)
+    warm_color_msgs([color])
+    msg = make_color_msg(Pos(5, 6), color)
+    assert make_color_msg(Pos(5, 6), color) is msg
+    assert list(msg.data) == list(constants.PUSH_SYSEX_PREFIX) + [4, 0, 8, 46, 0, 0, 11, 1, 6, 2, 1]
+
+
+def test_led_msg() -> None:
+    pos = Pos(1, 2)
+    msg = make_led_msg(pos, 100)
+    assert msg.type == 'note_on'
+    assert msg.note == pos.to_note()
+    assert msg.velocity == 100
+    assert make_led_msg(pos, 100) is msg
+    assert make_led_msg(pos, 0).velocity == 0
+
+
+def test_lcd_msg() -> None:
+    msg = make_lcd_msg(1, 17, 'Hi')
+    assert list(msg.data) == list(constants.PUSH_SYSEX_PREFIX) + [26, 0, 3, 17, ord('H'), ord('i')]
+
+
+@pytest.mark.parametrize(
+    'msg, event',
+    [
+        (FrozenMessage('note_on', note=36, velocity=100), PadEvent(Pos(0, 0), 100)),
+        (FrozenMessage('note_off', note=99, velocity=0), PadEvent(Pos(7, 7), 0)),
+        (FrozenMessage('note_on', note=20, velocity=100), None),
+        (FrozenMessage('control_change', control=ButtonCC.Undo.value, value=127), ButtonEvent(ButtonCC.Undo, True)),
+        (FrozenMessage('control_change', control=KnobCC.C1.value, value=1), KnobEvent(KnobCC.C1, KnobGroup.Center, 1, True)),
+        (FrozenMessage('control_change', control=KnobCC.R0.value, value=127), KnobEvent(KnobCC.R0, KnobGroup.Right, 0, False)),
+        (FrozenMessage('control_change', control=0, value=1), None),
+        (FrozenMessage('polytouch', note=36, value=10), None),
+        (FrozenMessage('pitchwheel', pitch=100), None),
+    ]
+)
+def test_match_event(msg: FrozenMessage, event: Optional[PushEvent]) -> None:
+    assert match_event(msg) == event
+
+
+class RecordingPort(BaseOutput):
+    def __init__(self) -> None:
+        super().__init__()
+        self.sent: List[Message] = []
+
+    def _send(self, msg: Message) -> None:
+        self.sent.append(msg)
+
+
+def test_pad_set_many() -> None:
+    port = RecordingPort()
+    push = PushOutput(MidiOutput('test', port, delay=None))
+    color = Color(1, 2, 3)
+    push.pad_set_many([(Pos(0, 0), color), (Pos(0, 1), None)])
+    assert port.sent == [make_color_msg(Pos(0, 0), color), make_led_msg(Pos(0, 1), 0)]
+
+
+def test_lcd_display_lines() -> None:
+    port = RecordingPort()
+    push = PushOutput(MidiOutput('test', port, delay=None))
+    push.lcd_display_lines([(0, 'Hi'), (3, 'There')])
+    assert port.sent == [
+        make_lcd_msg(0, 0, 'Hi'.ljust(constants.DISPLAY_MAX_LINE_LEN)),
+        make_lcd_msg(3, 0, 'There'.ljust(constants.DISPLAY_MAX_LINE_LEN))
+    ]
+
+
+def test_reset_bursts() -> None:
+    port = RecordingPort()
+    push = PushOutput(MidiOutput('test', port, delay=None))
+    push.button_reset()
+    push.pad_reset()
+    buttons = [FrozenMessage('control_change', control=button.value, value=0) for button in ButtonCC]
+    pads = [make_led_msg(pos, 0) for pos in Pos.iter_all()]
+    assert port.sent == buttons + pads
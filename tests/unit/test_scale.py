@@ -43,3 +43,6 @@ def test_scale(
     classifier = scale.to_classifier(root_name)
     assert is_root == classifier.is_root(cand_name)
     assert is_member == classifier.is_member(cand_name)
+    bit = 1 << cand_name.value
+    assert is_root == bool(classifier.root_mask & bit)
+    assert is_member == bool(classifier.member_mask & bit)
@@ -0,0 +1,111 @@
+from pushpluck.color import Color
+from pushpluck.constants import ButtonCC, ButtonColor, ButtonIllum, TimeDivCC
+from pushpluck.pos import ChanSelPos, GridSelPos, Pos
+from pushpluck.push import PushInterface
+from pushpluck.shadow import PushShadow
+from typing import Any, List, Tuple
+
+
+class RecordingPush(PushInterface):
+    def __init__(self) -> None:
+        self.calls: List[Tuple[Any, ...]] = []
+
+    def pad_led_off(self, pos: Pos) -> None:
+        self.calls.append(('pad_led_off', pos))
+
+    def pad_set_color(self, pos: Pos, color: Color) -> None:
+        self.calls.append(('pad_set_color', pos, color))
+
+    def lcd_display_raw(self, row: int, line_col: int, text: str) -> None:
+        self.calls.append(('lcd_display_raw', row, line_col, text))
+
+    def button_set_illum(self, button: ButtonCC, illum: ButtonIllum) -> None:
+        self.calls.append(('button_set_illum', button, illum))
+
+    def button_off(self, button: ButtonCC) -> None:
+        self.calls.append(('button_off', button))
+
+    def time_div_off(self, time_div: TimeDivCC) -> None:
+        raise NotImplementedError()
+
+    def chan_sel_set_color(self, cs_pos: ChanSelPos, illum: ButtonIllum, color: ButtonColor) -> None:
+        raise NotImplementedError()
+
+    def chan_sel_off(self, cs_pos: ChanSelPos) -> None:
+        raise NotImplementedError()
+
+    def grid_sel_set_color(self, gs_pos: GridSelPos, color: Color) -> None:
+        raise NotImplementedError()
+
+    def grid_sel_off(self, gs_pos: GridSelPos) -> None:
+        raise NotImplementedError()
+
+
+def test_shadow_pads() -> None:
+    push = RecordingPush()
+    shadow = PushShadow(push)
+    color = Color(1, 2, 3)
+    with shadow.context() as managed:
+        managed.pad_set_color(Pos(0, 0), color)
+        managed.pad_led_off(Pos(0, 1))
+    assert push.calls == [('pad_set_color', Pos(0, 0), color)]
+    push.calls.clear()
+    with shadow.context() as managed:
+        managed.pad_set_color(Pos(0, 0), color)
+    assert push.calls == []
+    with shadow.context() as managed:
+        managed.pad_led_off(Pos(0, 0))
+    assert push.calls == [('pad_led_off', Pos(0, 0))]
+
+
+def test_shadow_buttons() -> None:
+    push = RecordingPush()
+    shadow = PushShadow(push)
+    with shadow.context() as managed:
+        managed.button_off(ButtonCC.Undo)
+        managed.button_set_illum(ButtonCC.Master, ButtonIllum.Half)
+    assert push.calls == [('button_set_illum', ButtonCC.Master, ButtonIllum.Half)]
+    push.calls.clear()
+    with shadow.context() as managed:
+        managed.button_reset()
+        managed.button_set_illum(ButtonCC.Master, ButtonIllum.Half)
+    assert push.calls == []
+    with shadow.context() as managed:
+        managed.button_off(ButtonCC.Master)
+    assert push.calls == [('button_off', ButtonCC.Master)]
+
+
+def test_shadow_lcd() -> None:
+    push = RecordingPush()
+    shadow = PushShadow(push)
+    with shadow.context() as managed:
+        managed.lcd_display_block(0, 1, 'Hello')
+    assert len(push.calls) == 1
+    _, row, line_col, text = push.calls[0]
+    assert (row, line_col) == (0, 0)
+    assert text.strip() == 'Hello'
+    push.calls.clear()
+    with shadow.context() as managed:
+        managed.lcd_display_block(0, 1, 'Hello')
+    assert push.calls == []
+
+
+def test_shadow_soft_reset() -> None:
+    push = RecordingPush()
+    shadow = PushShadow(push)
+    color = Color(1, 2, 3)
+    with shadow.context() as managed:
+        managed.pad_set_color(Pos(0, 0), color)
+        managed.pad_set_color(Pos(0, 1), color)
+        managed.button_set_illum(ButtonCC.Master, ButtonIllum.Half)
+        managed.lcd_display_line(0, 'Hello')
+    push.calls.clear()
+    # Resetting and redrawing within a context only sends what changed
+    with shadow.context() as managed:
+        managed.lcd_reset()
+        managed.button_reset()
+        managed.pad_reset()
+        managed.pad_set_color(Pos(0, 0), color)
+        managed.button_set_illum(ButtonCC.Master, ButtonIllum.Half)
+        managed.lcd_display_line(0, 'Hello')
+    assert push.calls == [('pad_led_off', Pos(0, 1))]
@@ -56,3 +56,16 @@ def test_viewport(
     if str_pos is not None and direction != Direction.Forward:
         actual_pad_pos = viewport.pad_pos_from_str_pos(str_pos)
         assert actual_pad_pos == pad_pos
+
+
+@pytest.mark.parametrize('config', [DEFAULT_CONFIG, SHIFT_CONFIG, VERT_CONFIG])
+def test_viewport_tables(config: ViewportConfig) -> None:
+    # Tables are rebuilt when the config changes
+    viewport = Viewport(replace(config, str_offset=2, fret_offset=3))
+    viewport.handle_mapped_config(config)
+    fresh = Viewport(config)
+    for pos in Pos.iter_all():
+        str_pos = viewport.str_pos_from_pad_pos(pos)
+        assert str_pos == fresh.str_pos_from_pad_pos(pos)
+        if str_pos is not None:
+            assert viewport.pad_pos_from_str_pos(str_pos) is pos